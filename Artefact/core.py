@@ -3,14 +3,19 @@ Core utilities and configuration for Artefact.
 Provides central configuration, logging setup, and common utilities.
 """
 
+import copy
 import logging
+import math
 import os
 import json
 import time
 import shutil
+import stat
 import threading
+from collections import deque
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Iterable, Iterator, Set
 from datetime import datetime
 
 # Version and metadata
@@ -43,6 +48,7 @@ DEFAULT_CONFIG = {
         'backup_dir': './backups'
     },
     'resources': {
+        'enabled': False,  # Opt-in background resource monitor
         'max_memory': '80%',
         'max_cpu': '90%',
         'monitor_interval': 60  # seconds
@@ -54,13 +60,66 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Environment variables with this prefix override configuration values
+_ENV_PREFIX = "ARTEFACT_"
+_ENV_BOOLS = {'true': True, 'false': False}
+
+
+def _coerce_env_value(value: str) -> Any:
+    """Convert an environment variable string to bool, int or float if possible."""
+    flag = _ENV_BOOLS.get(value.lower())
+    if flag is not None:
+        return flag
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    # Leave words such as "inf" or "nan" as strings
+    return number if math.isfinite(number) else value
+
+
+# Marker cached by ArtefactConfig.get() for key paths that do not resolve
+_MISSING = object()
+
+# Private template used to build per-instance configs, so that mutations made
+# through ArtefactConfig.set() never leak back into DEFAULT_CONFIG.
+_DEFAULT_TEMPLATE = copy.deepcopy(DEFAULT_CONFIG)
+
+
+def _deep_merge(dst: Dict[str, Any], src: Mapping) -> None:
+    """Merge ``src`` into ``dst`` in place, descending into nested mappings.
+
+    Uses an explicit stack rather than recursion so deeply nested input cannot
+    hit the interpreter recursion limit.
+    """
+    stack = deque([(dst, src)])
+    while stack:
+        target, updates = stack.pop()
+        for key, value in updates.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, Mapping):
+                stack.append((current, value))
+            else:
+                target[key] = copy.deepcopy(value)
+
 
 class ArtefactConfig:
     """Central configuration manager for Artefact."""
     
+    # Resource monitor shared by all instances (see _setup_monitoring)
+    _monitor_thread: Optional[threading.Thread] = None
+    _monitor_stop: Optional[threading.Event] = None
+    
     def __init__(self, config_dict: Optional[Dict[str, Any]] = None):
         """Initialize configuration with optional custom settings."""
-        self._config = DEFAULT_CONFIG.copy()
+        self._config = copy.deepcopy(_DEFAULT_TEMPLATE)
+        self._get_cache: Dict[str, Any] = {}
+        self._path_cache: Dict[str, Path] = {}
+        self._ensured_dirs: Set[Path] = set()
         self._load_env_vars()
         if config_dict:
             self._update_config(config_dict)
@@ -68,33 +127,27 @@ class ArtefactConfig:
         self._setup_monitoring()
         
     def _load_env_vars(self):
-        """Load configuration from environment variables."""
-        prefix = "ARTEFACT_"
-        for key in os.environ:
-            if key.startswith(prefix):
-                config_key = key[len(prefix):].lower()
-                value = os.environ[key]
-                
-                # Convert to appropriate type
-                if value.lower() in ('true', 'false'):
-                    value = value.lower() == 'true'
-                elif value.isdigit():
-                    value = int(value)
-                elif value.replace('.', '').isdigit():
-                    value = float(value)
-                    
-                self.set(config_key, value)
+        """Load configuration from environment variables.
+        
+        ``ARTEFACT_<SECTION>_<KEY>`` targets ``<section>.<key>`` when the
+        section exists (e.g. ``ARTEFACT_LOGGING_LEVEL`` -> ``logging.level``);
+        anything else is stored under its flat lowercased name.
+        """
+        prefix = _ENV_PREFIX
+        plen = len(prefix)
+        for key, value in os.environ.items():
+            if not key.startswith(prefix):
+                continue
+            config_key = key[plen:].lower()
+            section, sep, rest = config_key.partition('_')
+            if sep and isinstance(self._config.get(section), dict):
+                config_key = f"{section}.{rest}"
+            self.set(config_key, _coerce_env_value(value))
     
     def _update_config(self, config_dict: Dict[str, Any]) -> None:
         """Recursively update configuration with new values."""
-        def update_nested(original, updates):
-            for key, value in updates.items():
-                if key in original and isinstance(original[key], dict) and isinstance(value, dict):
-                    update_nested(original[key], value)
-                else:
-                    original[key] = value
-        
-        update_nested(self._config, config_dict)
+        _deep_merge(self._config, config_dict)
+        self._invalidate_caches(config_dict.keys())
     
     def _setup_logging(self) -> None:
         """Setup logging based on configuration with rotation."""
@@ -109,6 +162,8 @@ class ArtefactConfig:
         # Setup root logger
         logger = logging.getLogger('Artefact')
         logger.setLevel(level)
+        from .error_handler import set_debug
+        set_debug(level <= logging.DEBUG)
         
         # Remove existing handlers
         for handler in logger.handlers[:]:
@@ -131,34 +186,55 @@ class ArtefactConfig:
             logger.addHandler(file_handler)
             
     def _setup_monitoring(self):
-        """Setup resource monitoring."""
-        import psutil
-        import threading
+        """Setup resource monitoring if enabled in the configuration."""
+        # Only one monitor runs per process; reconfiguring replaces it
+        ArtefactConfig.stop_monitoring()
+        if not self._config['resources'].get('enabled', False):
+            return
+        
+        resources = self._config['resources']
+        cpu_limit = float(str(resources['max_cpu']).rstrip('%'))
+        mem_limit = float(str(resources['max_memory']).rstrip('%'))
+        stop = threading.Event()
         
         def monitor_resources():
-            while True:
+            logger = logging.getLogger('Artefact')
+            try:
+                import psutil
+            except ImportError:
+                logger.warning("psutil not available - resource monitoring disabled")
+                return
+            
+            while not stop.is_set():
                 try:
                     # Get resource usage
                     cpu = psutil.cpu_percent(interval=1)
                     mem = psutil.virtual_memory().percent
                     
                     # Check thresholds
-                    cpu_limit = float(self._config['resources']['max_cpu'].rstrip('%'))
-                    mem_limit = float(self._config['resources']['max_memory'].rstrip('%'))
-                    
                     if cpu > cpu_limit or mem > mem_limit:
-                        logger = logging.getLogger('Artefact')
                         logger.warning(
-                            f"Resource usage high - CPU: {cpu}%, Memory: {mem}%"
+                            "Resource usage high - CPU: %s%%, Memory: %s%%", cpu, mem
                         )
                         
-                    time.sleep(self._config['resources']['monitor_interval'])
+                    stop.wait(resources['monitor_interval'])
                 except Exception as e:
-                    logging.error(f"Monitoring error: {e}")
+                    logging.error("Monitoring error: %s", e)
+                    stop.wait(resources['monitor_interval'])
                     
         # Start monitoring in background
-        thread = threading.Thread(target=monitor_resources, daemon=True)
+        thread = threading.Thread(target=monitor_resources, name='ArtefactMonitor', daemon=True)
+        ArtefactConfig._monitor_thread = thread
+        ArtefactConfig._monitor_stop = stop
         thread.start()
+    
+    @classmethod
+    def stop_monitoring(cls) -> None:
+        """Signal the running resource monitor, if any, to exit."""
+        if cls._monitor_stop is not None:
+            cls._monitor_stop.set()
+        cls._monitor_thread = None
+        cls._monitor_stop = None
         
     def save_config(self, path: Optional[Path] = None) -> None:
         """Save current configuration to JSON file."""
@@ -199,17 +275,27 @@ class ArtefactConfig:
         self._update_config(config)
         self._setup_logging()  # Reload logging with new config
     
+    def _invalidate_caches(self, sections: Iterable[str]) -> None:
+        """Drop cached lookups after the given top-level sections changed."""
+        self._get_cache.clear()
+        if 'paths' in sections:
+            self._path_cache.clear()
+            self._ensured_dirs.clear()
+    
     def get(self, key_path: str, default=None) -> Any:
         """Get configuration value using dot notation (e.g., 'logging.level')."""
-        keys = key_path.split('.')
-        value = self._config
-        
         try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+            value = self._get_cache[key_path]
+        except KeyError:
+            value = self._config
+            try:
+                for key in key_path.split('.'):
+                    value = value[key]
+            except (KeyError, TypeError):
+                value = _MISSING
+            self._get_cache[key_path] = value
+        
+        return default if value is _MISSING else value
     
     def set(self, key_path: str, value: Any) -> None:
         """Set configuration value using dot notation."""
@@ -222,6 +308,7 @@ class ArtefactConfig:
             config = config[key]
         
         config[keys[-1]] = value
+        self._invalidate_caches((keys[0],))
         
         # Reconfigure logging if logging settings changed
         if keys[0] == 'logging':
@@ -229,21 +316,30 @@ class ArtefactConfig:
     
     def get_temp_dir(self) -> Path:
         """Get temporary directory for operations."""
-        temp_dir = self.get('paths.temp_dir')
-        if temp_dir:
-            return Path(temp_dir)
-        return Path.cwd() / 'temp'
+        temp_dir = self._path_cache.get('temp_dir')
+        if temp_dir is None:
+            configured = self.get('paths.temp_dir')
+            temp_dir = Path(configured) if configured else Path.cwd() / 'temp'
+            self._path_cache['temp_dir'] = temp_dir
+        return temp_dir
     
     def get_output_dir(self) -> Path:
         """Get default output directory."""
-        return Path(self.get('paths.output_dir', './output'))
+        output_dir = self._path_cache.get('output_dir')
+        if output_dir is None:
+            output_dir = Path(self.get('paths.output_dir', './output'))
+            self._path_cache['output_dir'] = output_dir
+        return output_dir
     
     def ensure_output_dir(self, subdir: Optional[str] = None) -> Path:
         """Ensure output directory exists and return path."""
         output_dir = self.get_output_dir()
         if subdir:
             output_dir = output_dir / subdir
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # Only hit the filesystem the first time a directory is requested
+        if output_dir not in self._ensured_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
         return output_dir
 
 
@@ -269,53 +365,64 @@ def get_logger(name: str = 'Artefact') -> logging.Logger:
 
 def validate_file_path(file_path: Path, must_exist: bool = True) -> bool:
     """Validate that a file path is valid and optionally exists."""
-    if not isinstance(file_path, Path):
-        file_path = Path(file_path)
+    if not must_exist:
+        return True
     
-    if must_exist and not file_path.exists():
+    # One stat() answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(file_path)
+    except (OSError, ValueError):
         return False
     
-    if must_exist and not file_path.is_file():
-        return False
-    
-    return True
+    return stat.S_ISREG(st.st_mode)
 
 
 def validate_directory_path(dir_path: Path, must_exist: bool = True, create_if_missing: bool = False) -> bool:
     """Validate that a directory path is valid and optionally exists."""
-    if not isinstance(dir_path, Path):
-        dir_path = Path(dir_path)
+    if not must_exist:
+        return True
     
-    if must_exist and not dir_path.exists():
+    try:
+        st = os.stat(dir_path)
+    except FileNotFoundError:
         if create_if_missing:
             try:
-                dir_path.mkdir(parents=True, exist_ok=True)
+                os.makedirs(dir_path, exist_ok=True)
                 return True
             except Exception:
                 return False
         return False
-    
-    if must_exist and not dir_path.is_dir():
+    except (OSError, ValueError):
         return False
     
-    return True
+    return stat.S_ISDIR(st.st_mode)
+
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def format_bytes(bytes_count: int) -> str:
     """Format byte count into human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.2f} {unit}"
-        bytes_count /= 1024.0
-    return f"{bytes_count:.2f} PB"
+    if bytes_count < 1024:
+        return f"{bytes_count:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    idx = min((int(bytes_count).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_count / (1 << (idx * 10)):.2f} {_BYTE_UNITS[idx]}"
+
+
+# Translation table mapping characters that are invalid in filenames to '_'
+_SAFE_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
 
 
 def safe_filename(filename: str) -> str:
     """Create a safe filename by removing/replacing invalid characters."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename.strip()
+    return filename.translate(_SAFE_FILENAME_TABLE).strip()
+
+
+def safe_filenames(filenames: Iterable[str]) -> Iterator[str]:
+    """Apply safe_filename to each name in an iterable."""
+    table = _SAFE_FILENAME_TABLE
+    return (name.translate(table).strip() for name in filenames)
 
 
 class ProgressTracker:
@@ -327,13 +434,19 @@ class ProgressTracker:
         self.current = 0
         self.description = description
         self.logger = get_logger()
+        # Log roughly every 10%; track the next boundary instead of using modulo
+        self._tick = max(1, total // 10)
+        self._next_tick = self._tick
+        self._inv_total = 100.0 / total if total else 0.0
     
     def update(self, increment: int = 1) -> None:
         """Update progress by increment."""
-        self.current = min(self.current + increment, self.total)
-        if self.current % max(1, self.total // 10) == 0 or self.current == self.total:
-            percentage = (self.current / self.total) * 100
-            self.logger.info(f"{self.description}: {percentage:.1f}% ({self.current}/{self.total})")
+        self.current = current = min(self.current + increment, self.total)
+        if current >= self._next_tick or current == self.total:
+            self._next_tick = current + self._tick
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("%s: %.1f%% (%d/%d)", self.description,
+                                 current * self._inv_total, current, self.total)
     
     def finish(self) -> None:
         """Mark progress as complete."""
@@ -2,47 +2,95 @@
 Centralized error handling module for ArteFact.
 Handles exceptions, logs errors, and provides user-friendly fixes.
 """
+import atexit
 import logging
+import os
+import stat
 import time
 import json
+import sys
 import traceback
-from typing import Any, Callable, Optional, Union, List, Dict
-from collections import defaultdict
+from typing import Any, Callable, Optional, Union, List, Dict, Tuple
+from collections import Counter, deque
 from datetime import datetime
+from functools import wraps
 from pathlib import Path
-from rich.console import Console
 import re
-import subprocess
 
-# Configure logging
-console = Console()
-logger = logging.getLogger("Artefact")
+# Rich console, created on first use so importing this module stays cheap.
+# The Text class and prebuilt styles are set up alongside it, so printing an
+# error assembles styled Text directly instead of parsing markup each time.
+_console = None
+_Text = None
+_ERROR_STYLE = None
+_FIX_PREFIX = None
 
-# Error statistics tracking
-ERROR_STATS = defaultdict(lambda: {
-    'count': 0,
-    'first_seen': None,
-    'last_seen': None,
-    'contexts': set(),
-    'messages': set()
-})
+# Statistics are off by default; opt in with ARTEFACT_ERROR_STATS=1 or
+# set_statistics_enabled(True)
+_STATS_ENABLED = os.environ.get("ARTEFACT_ERROR_STATS", "0") == "1"
+# Distinct messages/contexts kept per error type, so long runs stay bounded
+MAX_MESSAGES_PER_TYPE = 64
+
+# Error statistics tracking, keyed by exception class name. The context and
+# message sets are only allocated once something is added to them.
+_COUNTS: Counter = Counter()
+_FIRST_SEEN: Dict[str, int] = {}  # time.time_ns(), formatted on read
+_LAST_SEEN: Dict[str, int] = {}
+_CONTEXTS: Dict[str, set] = {}
+_MESSAGES: Dict[str, set] = {}
+
+# handle_error() only queues (error_type, timestamp, context, message) records
+# here; they are folded into the statistics in batches by _flush_stats()
+_PENDING_STATS: deque = deque()
+_FLUSH_THRESHOLD = 128
+_FLUSH_INTERVAL = 5.0  # seconds between automatic saves to _STATS_FILE
+_STATS_FILE: Optional[Path] = None
+_last_flush = time.monotonic()
 
 # Custom error hooks
 ERROR_HOOKS: List[Callable[[Exception, Optional[str]], None]] = []
+# Immutable snapshot of ERROR_HOOKS iterated by handle_error()
+_ERROR_HOOKS_TUPLE: Tuple[Callable[[Exception, Optional[str]], None], ...] = ()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Whether handle_error prints stack traces; kept in sync by set_debug()
+_DEBUG_ENABLED = logging.getLogger("Artefact").isEnabledFor(logging.DEBUG)
+
+
+def set_debug(enabled: bool) -> None:
+    """
+    Enable or disable debug output (stack traces) for handled errors.
+    
+    The "Artefact" logger level is adjusted to match when it disagrees.
+    """
+    global _DEBUG_ENABLED
+    _DEBUG_ENABLED = bool(enabled)
+    logger = logging.getLogger("Artefact")
+    if _DEBUG_ENABLED != logger.isEnabledFor(logging.DEBUG):
+        logger.setLevel(logging.DEBUG if _DEBUG_ENABLED else logging.INFO)
+
 
 class ArtefactError(Exception):
     """Base class for ArteFact errors."""
     def __init__(self, message: str, recovery_steps: Optional[List[str]] = None):
         super().__init__(message)
         self.recovery_steps = recovery_steps or []
-        self.timestamp = datetime.now()
-        self.traceback = traceback.format_exc()
+        # Raw clock read only; the datetime is built on first access
+        self._created = time.time()
+        self._timestamp: Optional[datetime] = None
+        # Only format a traceback when raised while handling another exception
+        self.traceback = traceback.format_exc() if sys.exc_info()[0] is not None else None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Time the error was created."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created)
+        return self._timestamp
         
     def get_recovery_guide(self) -> str:
         """Get formatted recovery steps if available."""
@@ -52,43 +100,260 @@ class ArtefactError(Exception):
         steps = "\n".join(f"{i+1}. {step}" for i, step in enumerate(self.recovery_steps))
         return f"Recovery steps:\n{steps}"
 
+    @classmethod
+    def _artefact_format(cls, exc: Exception) -> Tuple[str, str, str]:
+        """Return the (label, detail, fix) handle_error prints for this error."""
+        return _format_unexpected(exc)
+
 
 class ValidationError(ArtefactError):
     """Raised when input validation fails."""
-    pass
+
+    @classmethod
+    def _artefact_format(cls, exc: Exception) -> Tuple[str, str, str]:
+        return ("Validation error:", str(exc),
+                "Check input parameters and ensure they meet requirements.")
 
 
 class ConfigurationError(ArtefactError):
     """Raised when configuration is invalid."""
-    pass
+
+    @classmethod
+    def _artefact_format(cls, exc: Exception) -> Tuple[str, str, str]:
+        return ("Configuration error:", str(exc),
+                "Check configuration file or environment variables.")
 
 
 class ProcessingError(ArtefactError):
     """Raised when processing operations fail."""
-    pass
+
+    @classmethod
+    def _artefact_format(cls, exc: Exception) -> Tuple[str, str, str]:
+        return ("Processing error:", str(exc),
+                "Check input data format and processing parameters.")
+
+
+Formatter = Callable[[Exception], Tuple[str, str, str]]
+
+# Exception type -> formatter returning (label, detail, fix) as plain text. Resolved by walking
+# the exception's MRO, so the most specific registered class wins.
+_HANDLERS: Dict[type, Formatter] = {}
+
+# Formatters for exceptions from modules this one does not import, keyed by
+# (module, qualified name) so e.g. subprocess is only loaded by its callers
+_NAMED_HANDLERS: Dict[Tuple[str, str], Formatter] = {}
+
+# Formatter resolved for each concrete exception type seen so far, so repeat
+# errors of the same type skip the MRO walk
+_FORMATTER_CACHE: Dict[type, Formatter] = {}
+
+
+def register_formatter(*exc_types: Union[type, str]) -> Callable[[Formatter], Formatter]:
+    """
+    Decorator registering a formatter for exception types.
+    
+    A formatter returns plain (label, detail, fix) strings; handle_error adds
+    the styling, so no Rich markup is needed (or interpreted).
+    
+    Types may be given as classes or as "module.QualName" strings, which
+    avoids importing the defining module just to register a formatter.
+    ArtefactError subclasses should override ``_artefact_format`` instead.
+    """
+    def decorator(formatter: Formatter) -> Formatter:
+        for exc_type in exc_types:
+            if isinstance(exc_type, str):
+                module, _, qualname = exc_type.rpartition('.')
+                _NAMED_HANDLERS[(module, qualname)] = formatter
+            else:
+                _HANDLERS[exc_type] = formatter
+        _FORMATTER_CACHE.clear()
+        return formatter
+    return decorator
+
+
+@register_formatter(FileNotFoundError)
+def _format_file_not_found(exc: Exception) -> Tuple[str, str, str]:
+    return ("Error:", f"File not found: {exc}",
+            "Check if the file path is correct and the file exists.")
+
+
+@register_formatter(PermissionError)
+def _format_permission(exc: Exception) -> Tuple[str, str, str]:
+    return ("Error:", f"Permission denied: {exc}",
+            "Check file permissions or try running as administrator.")
+
+
+# Fallback for ImportErrors raised by hand without a ``name``
+_IMPORT_MODULE_RE = re.compile(r"'([^']+)'")
+
+
+@register_formatter(ImportError)
+def _format_import(exc: Exception) -> Tuple[str, str, str]:
+    module_name = getattr(exc, "name", None)
+    if not module_name:
+        match = _IMPORT_MODULE_RE.search(str(exc))
+        module_name = match.group(1) if match else "unknown"
+    return ("Error:", f"Import failed: {exc}",
+            f"Install required package: pip install {module_name}")
+
+
+@register_formatter(ValueError)
+def _format_value(exc: Exception) -> Tuple[str, str, str]:
+    return ("Error:", str(exc),
+            "Verify the input values and formats.")
+
+
+@register_formatter(OSError)
+def _format_os(exc: Exception) -> Tuple[str, str, str]:
+    return ("OS error:", str(exc),
+            "Check file permissions, disk space, or file integrity.")
+
+
+@register_formatter(re.error)
+def _format_regex(exc: Exception) -> Tuple[str, str, str]:
+    return ("Regex error:", str(exc),
+            "Check your regular expression syntax.")
+
+
+@register_formatter('subprocess.SubprocessError')
+def _format_subprocess(exc: Exception) -> Tuple[str, str, str]:
+    error_msg = ""
+    if hasattr(exc, 'stderr') and exc.stderr:
+        error_msg += f"stderr: {exc.stderr}\n"
+    if hasattr(exc, 'stdout') and exc.stdout:
+        error_msg += f"stdout: {exc.stdout}"
+    return ("Subprocess error:", error_msg or str(exc),
+            "Check the command, its arguments, and system environment.")
+
+
+def _format_unexpected(exc: Exception) -> Tuple[str, str, str]:
+    return ("Unexpected error:", str(exc),
+            "See logs for more details or contact support.")
+
+
+def _resolve_formatter(exc: Exception) -> Formatter:
+    """Find the formatter for the most specific registered exception class."""
+    exc_type = type(exc)
+    formatter = _FORMATTER_CACHE.get(exc_type)
+    if formatter is None:
+        # ArteFact errors format themselves; skip the registry entirely
+        formatter = getattr(exc_type, '_artefact_format', None)
+        if formatter is None:
+            formatter = _format_unexpected
+            for cls in exc_type.__mro__:
+                found = _HANDLERS.get(cls) or _NAMED_HANDLERS.get(
+                    (cls.__module__, cls.__qualname__))
+                if found is not None:
+                    formatter = found
+                    break
+        _FORMATTER_CACHE[exc_type] = formatter
+    return formatter
+
+
+def _get_console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console, _Text, _ERROR_STYLE, _FIX_PREFIX
+    if _console is None:
+        from rich.console import Console
+        from rich.style import Style
+        from rich.text import Text
+        _Text = Text
+        _ERROR_STYLE = Style(color="red")
+        _FIX_PREFIX = Text("Fix:", style=Style(color="yellow"))
+        _console = Console()
+    return _console
 
 
 def register_error_hook(hook: Callable[[Exception, Optional[str]], None]) -> None:
     """Register a custom error handling hook."""
+    global _ERROR_HOOKS_TUPLE
     ERROR_HOOKS.append(hook)
+    _ERROR_HOOKS_TUPLE = tuple(ERROR_HOOKS)
+
+def _drain_pending_stats() -> None:
+    """Fold queued error records into the statistics tables."""
+    pending = _PENDING_STATS
+    while pending:
+        try:
+            error_type, now, context, message = pending.popleft()
+        except IndexError:
+            break
+        _COUNTS[error_type] += 1
+        _LAST_SEEN[error_type] = now
+        if error_type not in _FIRST_SEEN:
+            _FIRST_SEEN[error_type] = now
+        if context:
+            contexts = _CONTEXTS.get(error_type)
+            if contexts is None:
+                contexts = _CONTEXTS[error_type] = set()
+            if len(contexts) < MAX_MESSAGES_PER_TYPE:
+                contexts.add(context)
+        messages = _MESSAGES.get(error_type)
+        if messages is None:
+            messages = _MESSAGES[error_type] = set()
+        if len(messages) < MAX_MESSAGES_PER_TYPE:
+            messages.add(message)
+
+
+def _flush_stats(force_save: bool = False) -> None:
+    """Apply queued error records and save them to _STATS_FILE if due."""
+    global _last_flush
+    _drain_pending_stats()
+    if _STATS_FILE is not None and (
+            force_save or time.monotonic() - _last_flush >= _FLUSH_INTERVAL):
+        _last_flush = time.monotonic()
+        save_error_statistics(_STATS_FILE)
+
+
+def set_statistics_file(path: Optional[Path]) -> None:
+    """
+    Persist error statistics to ``path`` automatically.
+    
+    Statistics are written in batches (at most every few seconds while errors
+    are being handled) and once more at interpreter exit. Pass None to stop.
+    Setting a file also enables statistics tracking.
+    """
+    global _STATS_FILE
+    _STATS_FILE = Path(path) if path is not None else None
+    if _STATS_FILE is not None:
+        set_statistics_enabled(True)
+
+
+def set_statistics_enabled(enabled: bool) -> None:
+    """Turn error statistics tracking on or off."""
+    global _STATS_ENABLED
+    _STATS_ENABLED = bool(enabled)
+
+
+atexit.register(_flush_stats, True)
+
+
+def _format_ns(ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() value as an ISO timestamp."""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
 
 def get_error_statistics() -> Dict[str, Dict[str, Any]]:
     """Get current error statistics."""
+    _drain_pending_stats()
     stats = {}
-    for error_type, data in ERROR_STATS.items():
+    for error_type, count in _COUNTS.items():
         stats[error_type] = {
-            'count': data['count'],
-            'first_seen': data['first_seen'],
-            'last_seen': data['last_seen'],
-            'contexts': list(data['contexts']),
-            'messages': list(data['messages'])
+            'count': count,
+            'first_seen': _format_ns(_FIRST_SEEN.get(error_type)),
+            'last_seen': _format_ns(_LAST_SEEN.get(error_type)),
+            'contexts': list(_CONTEXTS.get(error_type, ())),
+            'messages': list(_MESSAGES.get(error_type, ()))
         }
     return stats
 
 def save_error_statistics(path: Path) -> None:
     """Save error statistics to JSON file."""
-    stats = get_error_statistics()
-    path.write_text(json.dumps(stats, indent=2, default=str))
+    data = json.dumps(get_error_statistics(), indent=2, default=str)
+    with open(path, 'w', buffering=65536) as f:
+        f.write(data)
 
 def handle_error(exc: Exception, context: Optional[str] = None) -> None:
     """
@@ -98,84 +363,37 @@ def handle_error(exc: Exception, context: Optional[str] = None) -> None:
         exc (Exception): The exception instance.
         context (str, optional): Additional context about where the error occurred.
     """
-    # Update error statistics
-    error_type = exc.__class__.__name__
-    now = datetime.now().isoformat()
+    # Queue the statistics update; it is applied in batches
+    if _STATS_ENABLED:
+        _PENDING_STATS.append(
+            (exc.__class__.__name__, time.time_ns(), context, str(exc))
+        )
+        if len(_PENDING_STATS) >= _FLUSH_THRESHOLD or _STATS_FILE is not None:
+            _flush_stats()
     
-    ERROR_STATS[error_type]['count'] += 1
-    ERROR_STATS[error_type]['last_seen'] = now
-    if not ERROR_STATS[error_type]['first_seen']:
-        ERROR_STATS[error_type]['first_seen'] = now
-    if context:
-        ERROR_STATS[error_type]['contexts'].add(context)
-    ERROR_STATS[error_type]['messages'].add(str(exc))
+    logger = logging.getLogger("Artefact")
     if context:
         logger.error(f"[{context}] {exc}")
     else:
         logger.error(str(exc))
 
-    # Print user-friendly message and suggest fixes
-    if isinstance(exc, FileNotFoundError):
-        console.print(f"[red]Error:[/] File not found: {exc}")
-        console.print("[yellow]Fix:[/] Check if the file path is correct and the file exists.")
-        
-    elif isinstance(exc, PermissionError):
-        console.print(f"[red]Error:[/] Permission denied: {exc}")
-        console.print("[yellow]Fix:[/] Check file permissions or try running as administrator.")
-        
-    elif isinstance(exc, ImportError):
-        console.print(f"[red]Error:[/] Import failed: {exc}")
-        module_name = str(exc).split("'")[1] if "'" in str(exc) else "unknown"
-        console.print(f"[yellow]Fix:[/] Install required package: pip install {module_name}")
-        
-    elif isinstance(exc, ValueError):
-        console.print(f"[red]Error:[/] {exc}")
-        console.print("[yellow]Fix:[/] Verify the input values and formats.")
-        
-    elif isinstance(exc, OSError):
-        console.print(f"[red]OS error:[/] {exc}")
-        console.print("[yellow]Fix:[/] Check file permissions, disk space, or file integrity.")
-        
-    elif isinstance(exc, re.error):
-        console.print(f"[red]Regex error:[/] {exc}")
-        console.print("[yellow]Fix:[/] Check your regular expression syntax.")
-        
-    elif isinstance(exc, subprocess.SubprocessError):
-        error_msg = ""
-        if hasattr(exc, 'stderr') and exc.stderr:
-            error_msg += f"stderr: {exc.stderr}\n"
-        if hasattr(exc, 'stdout') and exc.stdout:
-            error_msg += f"stdout: {exc.stdout}"
-        console.print(f"[red]Subprocess error:[/] {error_msg or str(exc)}")
-        console.print("[yellow]Fix:[/] Check the command, its arguments, and system environment.")
-        
-    elif isinstance(exc, ValidationError):
-        console.print(f"[red]Validation error:[/] {exc}")
-        console.print("[yellow]Fix:[/] Check input parameters and ensure they meet requirements.")
-        
-    elif isinstance(exc, ConfigurationError):
-        console.print(f"[red]Configuration error:[/] {exc}")
-        console.print("[yellow]Fix:[/] Check configuration file or environment variables.")
-        
-    elif isinstance(exc, ProcessingError):
-        console.print(f"[red]Processing error:[/] {exc}")
-        console.print("[yellow]Fix:[/] Check input data format and processing parameters.")
-        
-    else:
-        console.print(f"[red]Unexpected error:[/] {exc}")
-        console.print("[yellow]Fix:[/] See logs for more details or contact support.")
-    
-    # Add stack trace in debug mode
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        console.print("[red]Stack trace:[/]")
-        console.print(traceback.format_exc())
+    # Print user-friendly message and suggest fixes, plus the stack trace in
+    # debug mode, as a single console write
+    label, detail, fix = _resolve_formatter(exc)(exc)
+    console = _get_console()
+    parts = [(label, _ERROR_STYLE), " ", detail, "\n", _FIX_PREFIX, " ", fix]
+    if _DEBUG_ENABLED:
+        parts += ["\n", ("Stack trace:", _ERROR_STYLE), "\n", traceback.format_exc()]
+    console.print(_Text.assemble(*parts))
     
     # Execute custom error hooks
-    for hook in ERROR_HOOKS:
-        try:
-            hook(exc, context)
-        except Exception as e:
-            logger.error(f"Error hook failed: {e}")
+    hooks = _ERROR_HOOKS_TUPLE
+    if hooks:
+        for hook in hooks:
+            try:
+                hook(exc, context)
+            except Exception as e:
+                logger.error(f"Error hook failed: {e}")
 
 
 def cli_error(msg: str, exc: Optional[Exception] = None, context: Optional[str] = None) -> None:
@@ -190,8 +408,108 @@ def cli_error(msg: str, exc: Optional[Exception] = None, context: Optional[str]
     if exc is not None:
         handle_error(exc, context)
     else:
-        console.print(f"[red]Error:[/] {msg}")
-        logger.error(msg)
+        console = _get_console()
+        console.print(_Text.assemble(("Error:", _ERROR_STYLE), " ", msg))
+        logging.getLogger("Artefact").error(msg)
+
+
+# Accepted values for validate_input(); the ordered tuples keep error
+# messages stable while the frozensets give O(1) membership checks
+_VALID_HASH_ALGORITHMS = ('md5', 'sha1', 'sha256', 'sha512', 'blake2b', 'blake3')
+_VALID_OUTPUT_FORMATS = ('json', 'csv', 'table', 'markdown')
+_VALID_FILE_TYPES = (
+    # Images
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp',
+    # Documents
+    'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'txt', 'rtf',
+    # Executables and Libraries
+    'exe', 'dll', 'sys', 'so', 'dylib',
+    # Archives
+    'zip', 'rar', '7z', 'tar', 'gz',
+    # Memory and disk images
+    'mem', 'raw', 'vmem', 'dmp', 'img', 'iso',
+    # Other forensic artifacts
+    'evt', 'evtx', 'reg', 'log'
+)
+_HASH_ALGORITHM_SET = frozenset(_VALID_HASH_ALGORITHMS)
+_OUTPUT_FORMAT_SET = frozenset(_VALID_OUTPUT_FORMATS)
+_FILE_TYPE_SET = frozenset(_VALID_FILE_TYPES)
+
+
+def _to_path(value: Any, validation_type: str) -> Path:
+    if isinstance(value, Path):
+        return value
+    try:
+        return Path(value)
+    except TypeError as e:
+        raise ValidationError(f"Validation failed for {validation_type}: {e}")
+
+
+def _validate_file(value: Any, **kwargs) -> None:
+    path = _to_path(value, 'file')
+    # One stat() call answers both "exists" and "is a regular file"
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise ValidationError(f"File does not exist: {value}")
+    except (OSError, ValueError) as e:  # ValueError: embedded null byte
+        raise ValidationError(f"Validation failed for file: {e}")
+    if not stat.S_ISREG(mode):
+        raise ValidationError(f"Path is not a file: {value}")
+
+
+def _validate_directory(value: Any, **kwargs) -> None:
+    path = _to_path(value, 'directory')
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        if not kwargs.get('create_if_missing', False):
+            raise ValidationError(f"Directory does not exist: {value}")
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise ValidationError(f"Validation failed for directory: {e}")
+        return
+    except (OSError, ValueError) as e:  # ValueError: embedded null byte
+        raise ValidationError(f"Validation failed for directory: {e}")
+    if not stat.S_ISDIR(mode):
+        raise ValidationError(f"Path is not a directory: {value}")
+
+
+def _validate_hash_algorithm(value: Any, **kwargs) -> None:
+    if not isinstance(value, str) or value.lower() not in _HASH_ALGORITHM_SET:
+        raise ValidationError(f"Invalid hash algorithm: {value}. Valid options: {', '.join(_VALID_HASH_ALGORITHMS)}")
+
+
+def _validate_output_format(value: Any, **kwargs) -> None:
+    if not isinstance(value, str) or value.lower() not in _OUTPUT_FORMAT_SET:
+        raise ValidationError(f"Invalid output format: {value}. Valid options: {', '.join(_VALID_OUTPUT_FORMATS)}")
+
+
+def _validate_file_types(value: Any, **kwargs) -> None:
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, (list, tuple, set)):
+        raise ValidationError(f"Invalid file types: {value}. Expected a file type or a list of file types")
+    # Lowercase each entry once; the all-valid case is a single C-level
+    # superset check and only failures pay for building the error list
+    lowered = [t.lower() if isinstance(t, str) else None for t in value]
+    if _FILE_TYPE_SET.issuperset(lowered):
+        return
+    invalid_types = [str(t) for t, low in zip(value, lowered)
+                     if low not in _FILE_TYPE_SET]
+    if invalid_types:
+        raise ValidationError(f"Invalid file types: {', '.join(invalid_types)}. Valid options: {', '.join(_VALID_FILE_TYPES)}")
+
+
+# validation_type -> validator raising ValidationError on bad input
+_VALIDATORS: Dict[str, Callable[..., None]] = {
+    'file': _validate_file,
+    'directory': _validate_directory,
+    'hash_algorithm': _validate_hash_algorithm,
+    'output_format': _validate_output_format,
+    'file_types': _validate_file_types,
+}
 
 
 def validate_input(value: Any, validation_type: str, **kwargs) -> bool:
@@ -209,64 +527,10 @@ def validate_input(value: Any, validation_type: str, **kwargs) -> bool:
     Raises:
         ValidationError: If validation fails
     """
-    try:
-        if validation_type == 'file':
-            from pathlib import Path
-            path = Path(value)
-            if not path.exists():
-                raise ValidationError(f"File does not exist: {value}")
-            if not path.is_file():
-                raise ValidationError(f"Path is not a file: {value}")
-                
-        elif validation_type == 'directory':
-            from pathlib import Path
-            path = Path(value)
-            if not path.exists():
-                if kwargs.get('create_if_missing', False):
-                    path.mkdir(parents=True, exist_ok=True)
-                else:
-                    raise ValidationError(f"Directory does not exist: {value}")
-            elif not path.is_dir():
-                raise ValidationError(f"Path is not a directory: {value}")
-                
-        elif validation_type == 'hash_algorithm':
-            valid_algorithms = ['md5', 'sha1', 'sha256', 'sha512']
-            if value.lower() not in valid_algorithms:
-                raise ValidationError(f"Invalid hash algorithm: {value}. Valid options: {', '.join(valid_algorithms)}")
-                
-        elif validation_type == 'output_format':
-            valid_formats = ['json', 'csv', 'table', 'markdown']
-            if value.lower() not in valid_formats:
-                raise ValidationError(f"Invalid output format: {value}. Valid options: {', '.join(valid_formats)}")
-                
-        elif validation_type == 'file_types':
-            if isinstance(value, str):
-                value = [value]
-            valid_types = [
-                # Images
-                'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp',
-                # Documents
-                'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'txt', 'rtf',
-                # Executables and Libraries
-                'exe', 'dll', 'sys', 'so', 'dylib',
-                # Archives
-                'zip', 'rar', '7z', 'tar', 'gz',
-                # Memory and disk images
-                'mem', 'raw', 'vmem', 'dmp', 'img', 'iso',
-                # Other forensic artifacts
-                'evt', 'evtx', 'reg', 'log'
-            ]
-            invalid_types = [t for t in value if t.lower() not in valid_types]
-            if invalid_types:
-                raise ValidationError(f"Invalid file types: {', '.join(invalid_types)}. Valid options: {', '.join(valid_types)}")
-                
-        return True
-        
-    except Exception as e:
-        if isinstance(e, ValidationError):
-            raise
-        else:
-            raise ValidationError(f"Validation failed for {validation_type}: {str(e)}")
+    validator = _VALIDATORS.get(validation_type)
+    if validator is not None:
+        validator(value, **kwargs)
+    return True
 
 
 def safe_execute(func: Callable[..., Any], *args: Any, context: Optional[str] = None, **kwargs: Any) -> Optional[Any]:
@@ -300,13 +564,16 @@ def with_error_handling(context: Optional[str] = None) -> Callable:
         Callable: Decorated function with error handling
     """
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Resolved once per decorated function rather than on every error
+        _handle_error = handle_error
+        error_context = context or func.__name__
+        
+        @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                handle_error(e, context=context or func.__name__)
+                _handle_error(e, context=error_context)
                 raise
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
         return wrapper
     return decorator
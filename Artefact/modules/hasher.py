@@ -3,14 +3,17 @@ File and Directory Hashing Module
 =================================
 
 Provides secure hashing functionality for files and directories
-using various algorithms (MD5, SHA1, SHA256, SHA512).
+using various algorithms (MD5, SHA1, SHA256, SHA512, BLAKE2b and, when
+the blake3 package is installed, BLAKE3).
 """
 
 import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Iterator, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
@@ -25,10 +28,25 @@ SUPPORTED_ALGORITHMS = {
     "sha1": hashlib.sha1,
     "sha256": hashlib.sha256,
     "sha512": hashlib.sha512,
+    "blake2b": hashlib.blake2b,
 }
 
+# Optional BLAKE3 support (SIMD and multithreaded)
+try:
+    import blake3
+    SUPPORTED_ALGORITHMS["blake3"] = blake3.blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 CHUNK_SIZE = 64 * 1024  # 64KB chunks for efficient memory usage
 
+# Threads used by hash_directory/batch_hash_files
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# hashlib.file_digest is only available on Python 3.11+
+_FILE_DIGEST = getattr(hashlib, "file_digest", None)
+
 
 @with_error_handling("hash_file")
 def hash_file(file_path: Path, algorithm: str = "sha256") -> str:
@@ -37,7 +55,7 @@ def hash_file(file_path: Path, algorithm: str = "sha256") -> str:
     
     Args:
         file_path: Path to the file to hash
-        algorithm: Hash algorithm to use (md5, sha1, sha256, sha512)
+        algorithm: Hash algorithm to use (md5, sha1, sha256, sha512, blake2b, blake3)
         
     Returns:
         Hexadecimal hash string
@@ -60,16 +78,25 @@ def hash_file(file_path: Path, algorithm: str = "sha256") -> str:
     if not file_path.is_file():
         raise ValidationError(f"Path is not a file: {file_path}")
     
-    # Initialize hasher
-    hasher = SUPPORTED_ALGORITHMS[algorithm.lower()]()
+    constructor = SUPPORTED_ALGORITHMS[algorithm.lower()]
     
     try:
-        with file_path.open("rb") as f:
-            while True:
-                chunk = f.read(CHUNK_SIZE)
-                if not chunk:
-                    break
-                hasher.update(chunk)
+        if algorithm.lower() == "blake3":
+            # BLAKE3 maps the file itself and hashes it on multiple threads
+            hasher = constructor(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+        else:
+            with file_path.open("rb") as f:
+                if _FILE_DIGEST is not None:
+                    # Python 3.11+: C-level read loop with the GIL released
+                    hasher = _FILE_DIGEST(f, constructor)
+                else:
+                    hasher = constructor()
+                    while True:
+                        chunk = f.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        hasher.update(chunk)
         
         result = hasher.hexdigest()
         logger.debug(f"Calculated {algorithm.upper()} hash for {file_path}: {result}")
@@ -81,6 +108,56 @@ def hash_file(file_path: Path, algorithm: str = "sha256") -> str:
         raise RuntimeError(f"Failed to hash file {file_path}: {str(e)}")
 
 
+def _iter_files(root: Path, recursive: bool, include_hidden: bool) -> Iterator[Path]:
+    """
+    Yield the files under root using os.scandir.
+    
+    Entry types come from the directory listing itself, so unlike
+    Path.glob() + is_file() there is no stat() per file. Hidden entries
+    (names starting with '.') below root are skipped unless requested, and
+    symlinked directories are not descended into. Directories that cannot
+    be listed are skipped, as Path.glob() did.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {directory}: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if not include_hidden and entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(Path(entry.path))
+                elif entry.is_file():
+                    yield Path(entry.path)
+
+
+def _hash_concurrently(
+    file_paths: List[Path], 
+    algorithm: str
+) -> Iterator[Tuple[Path, str]]:
+    """
+    Hash files on a thread pool, yielding (path, hash) in input order.
+    
+    hashlib releases the GIL while digesting, so threads overlap both disk
+    I/O and hashing. Failures are logged and yielded as "ERROR: ..." values.
+    """
+    def hash_one(file_path: Path) -> str:
+        try:
+            return hash_file(file_path, algorithm)
+        except Exception as e:
+            logger.warning(f"Failed to hash {file_path}: {str(e)}")
+            return f"ERROR: {str(e)}"
+    
+    with ThreadPoolExecutor(max_workers=MAX_HASH_WORKERS) as executor:
+        yield from zip(file_paths, executor.map(hash_one, file_paths))
+
+
 @with_error_handling("hash_directory")
 def hash_directory(
     dir_path: Path, 
@@ -119,15 +196,7 @@ def hash_directory(
         raise ValidationError(f"Unsupported algorithm: {algorithm}")
     
     # Collect files to hash
-    files_to_hash = []
-    pattern = "**/*" if recursive else "*"
-    
-    for file_path in dir_path.glob(pattern):
-        if file_path.is_file():
-            # Skip hidden files if not requested
-            if not include_hidden and any(part.startswith('.') for part in file_path.parts):
-                continue
-            files_to_hash.append(file_path)
+    files_to_hash = list(_iter_files(dir_path, recursive, include_hidden))
     
     if not files_to_hash:
         console.print(f"[yellow]No files found in directory: {dir_path}[/]")
@@ -146,15 +215,9 @@ def hash_directory(
     ) as progress:
         task = progress.add_task(f"Hashing files ({algorithm.upper()})", total=len(files_to_hash))
         
-        for file_path in files_to_hash:
-            try:
-                file_hash = hash_file(file_path, algorithm)
-                results[str(file_path.relative_to(dir_path))] = file_hash
-                progress.advance(task)
-            except Exception as e:
-                logger.warning(f"Failed to hash {file_path}: {str(e)}")
-                results[str(file_path.relative_to(dir_path))] = f"ERROR: {str(e)}"
-                progress.advance(task)
+        for file_path, file_hash in _hash_concurrently(files_to_hash, algorithm):
+            results[str(file_path.relative_to(dir_path))] = file_hash
+            progress.advance(task)
     
     # Display results
     _display_results(results, algorithm, output_format)
@@ -216,14 +279,8 @@ def batch_hash_files(file_list: List[Path], algorithm: str = "sha256") -> Dict[s
     ) as progress:
         task = progress.add_task(f"Hashing {len(file_list)} files", total=len(file_list))
         
-        for file_path in file_list:
-            try:
-                file_hash = hash_file(file_path, algorithm)
-                results[str(file_path)] = file_hash
-            except Exception as e:
-                logger.warning(f"Failed to hash {file_path}: {str(e)}")
-                results[str(file_path)] = f"ERROR: {str(e)}"
-            
+        for file_path, file_hash in _hash_concurrently(file_list, algorithm):
+            results[str(file_path)] = file_hash
             progress.advance(task)
     
     return results
@@ -17,18 +17,27 @@ import re
 import os
 import json
 import logging
+import mmap
+import hashlib
+import struct
+import sys
+from bisect import bisect_left
 import tempfile
-from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass, field, asdict
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict, replace
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any, BinaryIO, Generator
+from typing import Dict, List, Optional, Set, Tuple, Any, Callable, Iterator, Union
 
+import numpy as np
 import yara
 import psutil
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
+from rich.text import Text
 
 from Artefact.error_handler import handle_error, ValidationError, with_error_handling
 from Artefact.core import get_logger
@@ -49,6 +58,20 @@ except ImportError:
     VOLATILITY_AVAILABLE = False
     logger.info("Volatility3 not available - install with 'pip install volatility3' for enhanced memory analysis")
 
+# Hyperscan lets extract_iocs rule out absent IOC types in one pass
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Optional fast JSON encoder for --json output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Memory dump formats
 MEMORY_FORMATS = {
     '.raw': {'description': 'Raw memory dump', 'handler': 'raw'},
@@ -59,6 +82,31 @@ MEMORY_FORMATS = {
     '.aff4': {'description': 'AFF4 memory image', 'handler': 'aff4'}
 }
 
+# Progress granularity when carving a mapped dump; large enough that the
+# per-window find() calls for each type are amortised
+_CARVE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Dumps larger than this are carved in ranges of this size by worker processes
+_CARVE_RANGE_SIZE = 64 * 1024 * 1024
+
+# Bytes scanned between progress redraws when extracting strings
+_PROGRESS_STEP = 16 * 1024 * 1024
+
+# Dumps at least this large have their string encodings scanned in parallel
+_PARALLEL_STRINGS_MIN_SIZE = 64 * 1024 * 1024
+
+# Per-user cache for Volatility results and compiled YARA rules
+_CACHE_DIR = Path.home() / '.cache' / 'artefact'
+
+# Volatility plugin results are cached per dump, keyed by a fingerprint of its
+# first and last MiB plus its size. Bump the version whenever the cached layout
+# changes so that stale entries are ignored.
+_VOLATILITY_CACHE_VERSION = 1
+_FINGERPRINT_SPAN = 1024 * 1024
+
+# Rule files picked up by _load_or_compile_rules
+_YARA_RULE_SUFFIXES = ('.yar', '.yara')
+
 @dataclass
 class ProcessInfo:
     """Container for process information from memory dump."""
@@ -82,7 +130,54 @@ class MemoryRegion:
     state: str
     type: str
     mapped_file: Optional[str] = None
-    content: Optional[bytes] = None
+
+@dataclass
+class RegionTable:
+    """
+    Memory regions stored column by column.
+    
+    Dumps can describe tens of thousands of regions; packed offset and size
+    arrays plus one list per text column avoid a dataclass instance per
+    region. Region contents are not stored at all: content() returns a view
+    of the dump's mapping on demand.
+    """
+    starts: array = field(default_factory=lambda: array('Q'))
+    sizes: array = field(default_factory=lambda: array('Q'))
+    protections: List[str] = field(default_factory=list)
+    states: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    mapped_files: List[Optional[str]] = field(default_factory=list)
+    
+    def append(self, region: MemoryRegion) -> None:
+        """Add a region as a new row."""
+        self.starts.append(region.start)
+        self.sizes.append(region.size)
+        self.protections.append(region.protection)
+        self.states.append(region.state)
+        self.types.append(region.type)
+        self.mapped_files.append(region.mapped_file)
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def __getitem__(self, index: int) -> MemoryRegion:
+        """Build a transient MemoryRegion for one row."""
+        return MemoryRegion(
+            start=self.starts[index],
+            size=self.sizes[index],
+            protection=self.protections[index],
+            state=self.states[index],
+            type=self.types[index],
+            mapped_file=self.mapped_files[index]
+        )
+    
+    def __iter__(self) -> Iterator[MemoryRegion]:
+        return (self[i] for i in range(len(self)))
+    
+    def content(self, mm: mmap.mmap, index: int) -> memoryview:
+        """Return a zero-copy view of a region's bytes in the mapped dump."""
+        start = self.starts[index]
+        return memoryview(mm)[start:start + self.sizes[index]]
 
 @dataclass
 class MemoryDump:
@@ -93,15 +188,241 @@ class MemoryDump:
     architecture: Optional[str] = None
     os_info: Optional[Dict[str, str]] = None
     processes: List[ProcessInfo] = field(default_factory=list)
-    regions: List[MemoryRegion] = field(default_factory=list)
+    regions: RegionTable = field(default_factory=RegionTable)
+
+@lru_cache(maxsize=8)
+def _string_patterns(min_length: int) -> Dict[str, 're.Pattern[bytes]']:
+    """Compiled string patterns per encoding, built once per minimum length."""
+    return {
+        'ascii': re.compile(rb'[\x20-\x7E]{%d,}' % min_length),
+        'utf-8': re.compile(rb'(?:[\x20-\x7E]|[\xC2-\xDF][\x80-\xBF]|\xE0[\xA0-\xBF][\x80-\xBF]|[\xE1-\xEC\xEE\xEF][\x80-\xBF]{2}|\xED[\x80-\x9F][\x80-\xBF]){%d,}' % min_length),
+        'utf-16le': re.compile(b'(?:[\x20-\x7E]\x00){%d,}' % min_length),
+        'utf-16be': re.compile(b'(?:\x00[\x20-\x7E]){%d,}' % min_length)
+    }
 
-def _chunk_reader(file: BinaryIO, chunk_size: int = 1024*1024) -> Generator[bytes, None, None]:
-    """Read file in chunks to handle large files."""
-    while True:
-        chunk = file.read(chunk_size)
-        if not chunk:
-            break
-        yield chunk
+# Encodings _printable_runs handles: (bytes per character, index of the
+# printable byte within it); any other byte of a character must be zero
+_RUN_ENCODINGS = {
+    'ascii': (1, 0),
+    'utf-16le': (2, 0),
+    'utf-16be': (2, 1),
+}
+
+def _printable_runs(
+    data: Any,
+    min_length: int,
+    encoding: str
+) -> Iterator[Tuple[int, List[int], List[int]]]:
+    """
+    Find runs of at least min_length printable characters with NumPy.
+    
+    Equivalent to finditer() with the encoding's string pattern, but
+    classifies a whole window of characters per vector operation and only
+    locates the edges between printable and non-printable ones. For UTF-16
+    each byte alignment is scanned separately; a run's bytes fix its
+    alignment, so runs of the two never overlap.
+    
+    data (bytes or an mmap) is processed in _PROGRESS_STEP windows to bound
+    the temporary arrays; a run still open at the end of one window is
+    carried into the next. Runs are yielded in offset order: the two UTF-16
+    alignments are merged per window, and no run of one alignment can start
+    inside a run of the other that is still open, since their bytes differ.
+    
+    Yields:
+        (bytes scanned so far, run starts, run ends) per window
+    """
+    width, char_at = _RUN_ENCODINGS[encoding]
+    size = len(data)
+    # Per alignment: start of a run left open, and the end of the last unit
+    open_starts: List[Optional[int]] = [None] * width
+    last_ends = [0] * width
+    
+    for base in range(0, size, _PROGRESS_STEP):
+        scanned = min(base + _PROGRESS_STEP, size)
+        # One extra byte so characters straddling the window end are seen
+        window = np.frombuffer(data, dtype=np.uint8, count=min(scanned + width - 1, size) - base,
+                               offset=base)
+        run_starts, run_ends = [], []
+        for align in range(width):
+            # Characters starting at base + align + width*i, fully inside data
+            count = max(0, -(-(min(scanned, size - width + 1) - base - align) // width))
+            if not count:
+                continue
+            first_pos = base + align
+            chars = window[align + char_at:align + char_at + width * count:width]
+            # Unsigned wrap-around makes this 0x20 <= b <= 0x7E in one compare
+            printable = (chars - np.uint8(0x20)) < np.uint8(0x5F)
+            if width > 1:
+                zero_at = align + 1 - char_at
+                printable &= window[zero_at:zero_at + width * count:width] == 0
+            
+            bounds = (np.flatnonzero(printable[1:] != printable[:-1]) + 1) * width + first_pos
+            first, last = bool(printable[0]), bool(printable[-1])
+            open_start = open_starts[align]
+            if first:
+                bounds = np.concatenate(([first_pos if open_start is None else open_start], bounds))
+            elif open_start is not None:
+                bounds = np.concatenate(([open_start, first_pos], bounds))
+            open_starts[align] = None
+            if last:
+                open_starts[align] = int(bounds[-1])
+                bounds = bounds[:-1]
+            last_ends[align] = first_pos + width * count
+            
+            starts, ends = bounds[0::2], bounds[1::2]
+            keep = ends - starts >= min_length * width
+            run_starts.append(starts[keep])
+            run_ends.append(ends[keep])
+        del window  # release the view before yielding
+        
+        if not run_starts:
+            yield scanned, [], []
+            continue
+        starts, ends = np.concatenate(run_starts), np.concatenate(run_ends)
+        if width > 1:
+            # Merge the alignments into offset order
+            order = np.argsort(starts)
+            starts, ends = starts[order], ends[order]
+        yield scanned, starts.tolist(), ends.tolist()
+    
+    tail = sorted((open_start, last_end) for open_start, last_end in zip(open_starts, last_ends)
+                  if open_start is not None and last_end - open_start >= min_length * width)
+    if tail:
+        yield size, [start for start, _ in tail], [end for _, end in tail]
+
+def _utf8_runs(data: Any, min_length: int) -> Iterator[Tuple[int, List[int], List[int]]]:
+    """
+    Find runs of at least min_length UTF-8 characters with NumPy.
+    
+    Equivalent to finditer() with the 'utf-8' string pattern: printable
+    ASCII plus well-formed two- and three-byte sequences. A lead byte fixes
+    the length of a character and continuation bytes never start one, so
+    every byte belongs to at most one character; a run is a chain of
+    characters each starting where the previous one ended, and its length
+    is the number of characters in it. min_length is only a threshold on
+    those counts, so nothing is compiled per minimum length.
+    
+    Windows and carried runs work as in _printable_runs, with two bytes of
+    lookahead for characters straddling the window end.
+    
+    Yields:
+        (bytes scanned so far, run starts, run ends) per window
+    """
+    size = len(data)
+    # Run still open at the end of the previous window: start, end, characters
+    open_run: Optional[Tuple[int, int, int]] = None
+    
+    for base in range(0, size, _PROGRESS_STEP):
+        scanned = min(base + _PROGRESS_STEP, size)
+        window = np.frombuffer(data, dtype=np.uint8, count=min(scanned + 2, size) - base,
+                               offset=base)
+        count = scanned - base
+        lead = window[:count]
+        # Bytes after each position; past the end of data they fail every test
+        next1 = np.zeros(count, dtype=np.uint8)
+        next2 = np.zeros(count, dtype=np.uint8)
+        next1[:len(window) - 1] = window[1:count + 1]
+        next2[:len(window) - 2] = window[2:count + 2]
+        del window  # release the view before yielding
+        
+        cont1 = (next1 & 0xC0) == 0x80
+        cont2 = (next2 & 0xC0) == 0x80
+        one = (lead - np.uint8(0x20)) < np.uint8(0x5F)
+        two = (lead >= 0xC2) & (lead <= 0xDF) & cont1
+        three = cont2 & (
+            ((lead == 0xE0) & cont1 & (next1 >= 0xA0))
+            | ((((lead >= 0xE1) & (lead <= 0xEC)) | (lead == 0xEE) | (lead == 0xEF)) & cont1)
+            | ((lead == 0xED) & cont1 & (next1 <= 0x9F))
+        )
+        starts = np.flatnonzero(one | two | three)
+        ends = starts + 1 + two[starts] + 2 * three[starts].astype(np.intp)
+        starts += base
+        ends += base
+        
+        run_starts: List[int] = []
+        run_ends: List[int] = []
+        if len(starts):
+            # Indexes of characters that do not continue the previous one
+            breaks = np.flatnonzero(ends[:-1] != starts[1:]) + 1
+            first_chars = np.concatenate(([0], breaks))
+            last_chars = np.concatenate((breaks, [len(starts)])) - 1
+            seg_starts = starts[first_chars]
+            seg_ends = ends[last_chars]
+            seg_counts = last_chars - first_chars + 1
+            if open_run is not None:
+                if open_run[1] == seg_starts[0]:
+                    seg_starts[0] = open_run[0]
+                    seg_counts[0] += open_run[2]
+                elif open_run[2] >= min_length:
+                    run_starts.append(open_run[0])
+                    run_ends.append(open_run[1])
+            # The last run may continue into the next window
+            open_run = (int(seg_starts[-1]), int(seg_ends[-1]), int(seg_counts[-1]))
+            keep = seg_counts[:-1] >= min_length
+            run_starts.extend(seg_starts[:-1][keep].tolist())
+            run_ends.extend(seg_ends[:-1][keep].tolist())
+        elif open_run is not None and open_run[1] < scanned:
+            # A window holding only the tail of the last character leaves it open
+            if open_run[2] >= min_length:
+                run_starts.append(open_run[0])
+                run_ends.append(open_run[1])
+            open_run = None
+        yield scanned, run_starts, run_ends
+    
+    if open_run is not None and open_run[2] >= min_length:
+        yield size, [open_run[0]], [open_run[1]]
+
+def _extract_encoding(
+    file_path: Path,
+    encoding: str,
+    min_length: int,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> List[Tuple[str, int]]:
+    """
+    Extract the strings of one encoding from a dump, in offset order.
+    
+    Module-level so extract_strings can run encodings in worker processes.
+    The dump is searched through a read-only mapping rather than read in
+    chunks: no per-chunk copies, and no strings split at chunk boundaries.
+    
+    Args:
+        file_path: Path to memory dump (non-empty)
+        encoding: Encoding to extract
+        min_length: Minimum string length
+        on_progress: Optional callback given the number of bytes scanned
+    """
+    found = []
+    with file_path.open('rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        if encoding in _RUN_ENCODINGS:
+            # Vectorised run finder instead of the regex engine
+            # Runs arrive in offset order, one window's worth at a time
+            for scanned, starts, ends in _printable_runs(mm, min_length, encoding):
+                found.extend([(mm[start:end].decode(encoding), start)
+                              for start, end in zip(starts, ends)])
+                if on_progress:
+                    on_progress(scanned)
+            return found
+        if encoding == 'utf-8':
+            for scanned, starts, ends in _utf8_runs(mm, min_length):
+                found.extend([(mm[start:end].decode(encoding), start)
+                              for start, end in zip(starts, ends)])
+                if on_progress:
+                    on_progress(scanned)
+            return found
+        
+        append = found.append
+        next_update = _PROGRESS_STEP
+        for match in _string_patterns(min_length)[encoding].finditer(mm):
+            # Store string and file offset
+            append((match.group().decode(encoding, errors='replace'),
+                    match.start()))
+            if on_progress and match.end() >= next_update:
+                on_progress(match.end())
+                next_update = match.end() + _PROGRESS_STEP
+    return found
 
 @with_error_handling("extract_strings")
 def extract_strings(
@@ -131,13 +452,6 @@ def extract_strings(
     if not file_path.is_file():
         raise ValidationError(f"Path is not a file: {file_path}")
     
-    patterns = {
-        'ascii': re.compile(rb'[\x20-\x7E]{%d,}' % min_length),
-        'utf-8': re.compile(rb'(?:[\x20-\x7E]|[\xC2-\xDF][\x80-\xBF]|\xE0[\xA0-\xBF][\x80-\xBF]|[\xE1-\xEC\xEE\xEF][\x80-\xBF]{2}|\xED[\x80-\x9F][\x80-\xBF]){%d,}' % min_length),
-        'utf-16le': re.compile(b'(?:[\x20-\x7E]\x00){%d,}' % min_length),
-        'utf-16be': re.compile(b'(?:\x00[\x20-\x7E]){%d,}' % min_length)
-    }
-    
     results = {enc: [] for enc in encodings}
     total_size = file_path.stat().st_size
     
@@ -148,44 +462,114 @@ def extract_strings(
         TextColumn("• {task.completed}/{task.total} bytes"),
         TimeElapsedColumn()
     ) as progress:
-        task = progress.add_task("Extracting strings", total=total_size)
+        # Each encoding is one pass over the whole file
+        task = progress.add_task("Extracting strings", total=total_size * len(encodings))
+        if not total_size:
+            return results
         
-        with file_path.open('rb') as f:
-            offset = 0
-            for chunk in _chunk_reader(f):
-                # Search for strings in chunk
-                for encoding in encodings:
-                    matches = patterns[encoding].finditer(chunk)
-                    for match in matches:
-                        string_bytes = match.group()
-                        try:
-                            # Add context if requested
-                            if context_bytes > 0:
-                                start = max(0, match.start() - context_bytes)
-                                end = min(len(chunk), match.end() + context_bytes)
-                                context = chunk[start:end]
-                            
-                            # Decode string
-                            if encoding == 'ascii':
-                                string = string_bytes.decode('ascii', errors='replace')
-                            else:
-                                string = string_bytes.decode(encoding, errors='replace')
-                            
-                            # Store string and file offset
-                            results[encoding].append((string, offset + match.start()))
-                            
-                        except UnicodeDecodeError:
-                            continue
-                
-                offset += len(chunk)
-                progress.update(task, advance=len(chunk))
-    
-    # Sort results by offset
-    for encoding in results:
-        results[encoding].sort(key=lambda x: x[1])
+        if len(encodings) > 1 and total_size >= _PARALLEL_STRINGS_MIN_SIZE:
+            # Encodings are independent passes; scan them in parallel, each
+            # worker mapping the dump itself so only results cross processes
+            with ProcessPoolExecutor(max_workers=len(encodings)) as executor:
+                futures = {
+                    executor.submit(_extract_encoding, file_path, encoding, min_length): encoding
+                    for encoding in encodings
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    progress.advance(task, total_size)
+        else:
+            for done, encoding in enumerate(encodings):
+                base = done * total_size
+                results[encoding] = _extract_encoding(
+                    file_path, encoding, min_length,
+                    lambda scanned: progress.update(task, completed=base + scanned)
+                )
+                progress.update(task, completed=base + total_size)
     
     return results
 
+# Default IOC patterns; MULTILINE keeps ^/$ anchored to each string that
+# extract_iocs joins into one text
+_IOC_FLAGS = re.IGNORECASE | re.MULTILINE
+_IOC_PATTERN_SOURCES = {
+    'ipv4': r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b',
+    'ipv6': r'(?:^|(?<=\s))(?:(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:)*:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){6}:[0-9a-fA-F]{0,4}|(?:[0-9a-fA-F]{1,4}:){5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?::[0-9a-fA-F]{1,4}){1,6}|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}(?:%[0-9a-zA-Z]+)?|::(?:ffff(?::0{1,4})?:)?(?:[0-9]{1,3}\.){3}[0-9]{1,3}|(?:[0-9a-fA-F]{1,4}:){1,4}:(?:[0-9]{1,3}\.){3}[0-9]{1,3})(?:$|(?=\s))',
+    'domain': r'\b(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,}\b',
+    'url': r'(?:https?://|ftp://|file://|hxxps?://|fxp://)\S+',
+    'email': r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b',
+    'md5': r'\b[a-fA-F0-9]{32}\b',
+    'sha1': r'\b[a-fA-F0-9]{40}\b',
+    'sha256': r'\b[a-fA-F0-9]{64}\b',
+    'bitcoin': r'\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b',
+    'credit_card': r'\b(?:\d{4}[- ]){3}\d{4}|\d{16}\b'
+}
+_IOC_PATTERNS = {
+    name: re.compile(pattern, _IOC_FLAGS)
+    for name, pattern in _IOC_PATTERN_SOURCES.items()
+}
+# The same patterns for scanning ASCII text straight out of a dump
+_IOC_BYTE_PATTERNS = {
+    name: re.compile(pattern.encode(), _IOC_FLAGS)
+    for name, pattern in _IOC_PATTERN_SOURCES.items()
+}
+
+@lru_cache(maxsize=64)
+def _custom_ioc_pattern(pattern: Union[str, bytes]) -> 're.Pattern':
+    """Compile a caller-supplied IOC pattern once, however often it is reused."""
+    return re.compile(pattern, _IOC_FLAGS)
+
+# A literal that every match of a default IOC pattern contains
+_IOC_REQUIRED_LITERALS = {
+    'ipv4': '.',
+    'ipv6': ':',
+    'domain': '.',
+    'url': '://',
+    'email': '@',
+}
+
+@lru_cache(maxsize=None)
+def _ioc_prefilter_db() -> Optional['hyperscan.Database']:
+    """
+    Compile the default IOC patterns into one Hyperscan database.
+    
+    Patterns are compiled in prefilter mode, which may report false
+    positives but never misses a match, so the database only decides
+    which patterns are worth running through re.
+    """
+    flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+             | hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+             | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    expressions = [source.encode() for source in _IOC_PATTERN_SOURCES.values()]
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[flags] * len(expressions)
+        )
+    except Exception as e:
+        logger.debug(f"Hyperscan IOC prefilter unavailable: {e}")
+        return None
+    return db
+
+def _present_ioc_types(text: Union[str, bytes]) -> Optional[Set[str]]:
+    """Return the default IOC types that may match text, or None if unknown."""
+    db = _ioc_prefilter_db()
+    if db is None:
+        return None
+    names = list(_IOC_PATTERN_SOURCES)
+    present = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        present.add(names[pattern_id])
+    
+    if isinstance(text, str):
+        text = text.encode('utf-8', 'replace')
+    db.scan(text, match_event_handler=on_match)
+    return present
+
 @with_error_handling("extract_iocs")
 def extract_iocs(
     strings: List[str],
@@ -205,75 +589,255 @@ def extract_iocs(
     Returns:
         Dictionary of IOC types and their matches
     """
-    # Default IOC patterns
-    patterns = {
-        'ipv4': r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b',
-        'ipv6': r'(?:^|(?<=\s))(?:(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:)*:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){6}:[0-9a-fA-F]{0,4}|(?:[0-9a-fA-F]{1,4}:){5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?::[0-9a-fA-F]{1,4}){1,6}|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}(?:%[0-9a-zA-Z]+)?|::(?:ffff(?::0{1,4})?:)?(?:[0-9]{1,3}\.){3}[0-9]{1,3}|(?:[0-9a-fA-F]{1,4}:){1,4}:(?:[0-9]{1,3}\.){3}[0-9]{1,3})(?:$|(?=\s))',
-        'domain': r'\b(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,}\b',
-        'url': r'(?:https?://|ftp://|file://|hxxps?://|fxp://)\S+',
-        'email': r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b',
-        'md5': r'\b[a-fA-F0-9]{32}\b',
-        'sha1': r'\b[a-fA-F0-9]{40}\b',
-        'sha256': r'\b[a-fA-F0-9]{64}\b',
-        'bitcoin': r'\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b',
-        'credit_card': r'\b(?:\d{4}[- ]){3}\d{4}|\d{16}\b'
-    }
+    custom_patterns = custom_patterns or {}
     
-    # Add custom patterns
-    if custom_patterns:
-        patterns.update(custom_patterns)
+    # Extract default matches with one scan per pattern over all strings
+    # joined by newlines, rather than one findall() call per string per
+    # pattern; no default pattern can match across a newline
+    default_patterns = {name: pattern for name, pattern in _IOC_PATTERNS.items()
+                        if name not in custom_patterns}
+    results = _scan_iocs('\n'.join(strings), default_patterns)
     
-    # Compile patterns
-    compiled_patterns = {
-        name: re.compile(pattern, re.IGNORECASE)
-        for name, pattern in patterns.items()
-    }
+    # Custom patterns may well match a newline, so they still run over each
+    # string on its own; each is compiled once per pattern
+    results.update(_scan_each(strings, {
+        name: _custom_ioc_pattern(pattern) for name, pattern in custom_patterns.items()
+    }))
+    return _finish_iocs(results, dedup, validate)
+
+def _scan_iocs(text: Union[str, bytes], compiled_patterns: Dict[str, 're.Pattern']) -> Dict[str, List[str]]:
+    """
+    Run each default IOC pattern once over text.
     
-    # Extract matches
-    results = {name: [] for name in patterns}
+    Bytes matches are decoded as ASCII.
+    """
+    as_bytes = isinstance(text, bytes)
+    # One Hyperscan pass tells which default patterns can match at all
+    present = _present_ioc_types(text) if HYPERSCAN_AVAILABLE else None
+    results = {}
+    for ioc_type, pattern in compiled_patterns.items():
+        # Skip the regex scan when a literal every match needs is absent;
+        # the substring test runs at C speed
+        required = _IOC_REQUIRED_LITERALS.get(ioc_type)
+        if required is not None and as_bytes:
+            required = required.encode()
+        if (present is not None and ioc_type not in present) or \
+                (required is not None and required not in text):
+            results[ioc_type] = []
+            continue
+        matches = pattern.findall(text)
+        if as_bytes:
+            matches = [match.decode('ascii') for match in matches]
+        results[ioc_type] = matches
+    return results
+
+def _scan_each(parts: List[Any], compiled_patterns: Dict[str, 're.Pattern']) -> Dict[str, List[str]]:
+    """
+    Run each pattern over every string in parts separately.
     
-    for s in strings:
-        for ioc_type, pattern in compiled_patterns.items():
-            matches = pattern.findall(s)
-            if matches:
-                results[ioc_type].extend(matches)
+    Parts may be str, or bytes-like (then matches are decoded as ASCII).
+    """
+    as_bytes = bool(parts) and not isinstance(parts[0], str)
+    results = {}
+    for ioc_type, pattern in compiled_patterns.items():
+        findall = pattern.findall
+        matches = [match for part in parts for match in findall(part)]
+        if as_bytes:
+            matches = [match.decode('ascii') for match in matches]
+        results[ioc_type] = matches
+    return results
+
+def _finish_iocs(results: Dict[str, List[str]], dedup: bool, validate: bool) -> Dict[str, List[str]]:
+    """Deduplicate and validate raw IOC matches."""
+    # Remove duplicates before validating so each value is checked once
+    if dedup:
+        results = {k: list(set(v)) for k, v in results.items()}
     
     # Validate matches if requested
     if validate:
         results = _validate_iocs(results)
-    
-    # Remove duplicates if requested
-    if dedup:
-        results = {k: list(set(v)) for k, v in results.items()}
+        if dedup:
+            # Validation lower-cases hashes and emails, which can merge values
+            results = {k: list(set(v)) for k, v in results.items()}
     
     return results
 
+# String encodings whose IOCs stream_iocs looks for; ASCII runs are matched
+# as bytes straight from the mapping, UTF-16 runs are decoded first
+_DUMP_IOC_ENCODINGS = ('ascii', 'utf-16le', 'utf-16be')
+
+def stream_iocs(
+    file_path: Path,
+    min_length: int = 4,
+    custom_patterns: Optional[Dict[str, str]] = None,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield raw IOC matches from a memory dump as its strings are found.
+    
+    Each window of printable runs from _printable_runs is joined and
+    matched straight away, so neither a string list nor a text buffer for
+    the whole dump is ever built. Matches are neither validated nor
+    deduplicated.
+    
+    Args:
+        file_path: Path to memory dump (must exist)
+        min_length: Minimum string length
+        custom_patterns: Dictionary of custom regex patterns
+        on_progress: Optional callback given the number of bytes scanned,
+            counting one pass over the dump per encoding
+        
+    Yields:
+        (IOC type, matches) for each window with matches of that type
+    """
+    custom_patterns = custom_patterns or {}
+    str_patterns = {name: pattern for name, pattern in _IOC_PATTERNS.items()
+                    if name not in custom_patterns}
+    byte_patterns = {name: pattern for name, pattern in _IOC_BYTE_PATTERNS.items()
+                     if name not in custom_patterns}
+    # Custom patterns run over each string separately, as in extract_iocs
+    custom_str = {name: _custom_ioc_pattern(pattern) for name, pattern in custom_patterns.items()}
+    custom_bytes = {name: _custom_ioc_pattern(pattern.encode())
+                    for name, pattern in custom_patterns.items()}
+    
+    total_size = file_path.stat().st_size
+    if not total_size:
+        return
+    
+    with file_path.open('rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        for done, encoding in enumerate(_DUMP_IOC_ENCODINGS):
+            base = done * total_size
+            for scanned, starts, ends in _printable_runs(mm, min_length, encoding):
+                if starts:
+                    if encoding == 'ascii':
+                        with memoryview(mm) as view:
+                            runs = [view[start:end] for start, end in zip(starts, ends)]
+                            batch = _scan_iocs(b'\n'.join(runs), byte_patterns)
+                            batch.update(_scan_each(runs, custom_bytes))
+                            for run in runs:
+                                run.release()
+                    else:
+                        runs = [mm[start:end].decode(encoding) for start, end in zip(starts, ends)]
+                        batch = _scan_iocs('\n'.join(runs), str_patterns)
+                        batch.update(_scan_each(runs, custom_str))
+                    for ioc_type, matches in batch.items():
+                        if matches:
+                            yield ioc_type, matches
+                if on_progress:
+                    on_progress(base + scanned)
+
+@with_error_handling("extract_dump_iocs")
+def extract_dump_iocs(
+    file_path: Path,
+    min_length: int = 4,
+    custom_patterns: Optional[Dict[str, str]] = None,
+    dedup: bool = True,
+    validate: bool = True
+) -> Dict[str, List[str]]:
+    """
+    Extract IOCs from a memory dump without building its string list.
+    
+    Matches from stream_iocs are collected per type as they arrive, into
+    sets when deduplicating, so memory grows with the IOCs found rather
+    than with the strings in the dump.
+    
+    Args:
+        file_path: Path to memory dump
+        min_length: Minimum string length
+        custom_patterns: Dictionary of custom regex patterns
+        dedup: Remove duplicates
+        validate: Validate matches (e.g., valid IP addresses)
+        
+    Returns:
+        Dictionary of IOC types and their matches
+    """
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    if not file_path.is_file():
+        raise ValidationError(f"Path is not a file: {file_path}")
+    
+    names = list(_IOC_PATTERNS) + [name for name in (custom_patterns or {}) if name not in _IOC_PATTERNS]
+    collected = {name: set() if dedup else [] for name in names}
+    total_size = file_path.stat().st_size
+    
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn()
+    ) as progress:
+        task = progress.add_task("Extracting IOCs", total=total_size * len(_DUMP_IOC_ENCODINGS))
+        for ioc_type, matches in stream_iocs(
+            file_path, min_length, custom_patterns,
+            lambda scanned: progress.update(task, completed=scanned)
+        ):
+            if dedup:
+                collected[ioc_type].update(matches)
+            else:
+                collected[ioc_type].extend(matches)
+    
+    return _finish_iocs({k: list(v) for k, v in collected.items()}, dedup, validate)
+
+# Dotted quad with every octet in 0-255, leading zeros allowed; one C-level
+# match per value instead of split() plus four int() calls. socket.inet_aton
+# is not used because it also accepts octal, hex and short forms like "1.2".
+_IPV4_DOTTED_QUAD = re.compile(
+    r'(?:0*(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])\.){3}0*(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])',
+    re.ASCII
+)
+
+_HASH_IOC_TYPES = ('md5', 'sha1', 'sha256')
+
+def _valid_hex_values(values: List[str]) -> List[str]:
+    """Return the all-hex values lower-cased, in order, checking each length group in one pass."""
+    by_length: Dict[int, List[int]] = {}
+    for i, value in enumerate(values):
+        by_length.setdefault(len(value), []).append(i)
+    
+    valid = [False] * len(values)
+    for length, indices in by_length.items():
+        if not length:
+            for i in indices:
+                valid[i] = True
+            continue
+        # Non-ASCII characters become '?', which keeps lengths and fails the check
+        packed = ''.join(values[i] for i in indices).encode('ascii', 'replace')
+        chars = np.frombuffer(packed, dtype=np.uint8).reshape(-1, length)
+        folded = chars | 0x20
+        is_hex = (((chars >= 0x30) & (chars <= 0x39)) | ((folded >= 0x61) & (folded <= 0x66))).all(axis=1)
+        for i, ok in zip(indices, is_hex.tolist()):
+            valid[i] = ok
+    return [value.lower() for value, ok in zip(values, valid) if ok]
+
 def _validate_iocs(iocs: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """Validate extracted IOCs."""
     validated = {}
     
     for ioc_type, values in iocs.items():
+        if ioc_type == 'ipv4':
+            validated[ioc_type] = list(filter(_IPV4_DOTTED_QUAD.fullmatch, values))
+            continue
+        if ioc_type in _HASH_IOC_TYPES:
+            validated[ioc_type] = _valid_hex_values(values)
+            continue
+        
         valid_values = []
         
         for value in values:
             try:
-                if ioc_type == 'ipv4':
-                    # Validate IPv4 address
-                    octets = [int(x) for x in value.split('.')]
-                    if len(octets) == 4 and all(0 <= x <= 255 for x in octets):
-                        valid_values.append(value)
-                
-                elif ioc_type == 'domain':
+                if ioc_type == 'domain':
                     # Basic domain validation
                     if 1 < len(value) <= 253 and all(part and len(part) <= 63 
                                                    for part in value.split('.')):
                         valid_values.append(value)
                 
-                elif ioc_type in ['md5', 'sha1', 'sha256']:
-                    # Hash validation (check hex and length)
-                    if all(c in '0123456789abcdefABCDEF' for c in value):
-                        valid_values.append(value.lower())
-                
                 elif ioc_type == 'url':
                     # Basic URL validation
                     if '.' in value and ' ' not in value:
@@ -327,20 +891,26 @@ def analyze_memory_dump(file_path: Path) -> MemoryDump:
     # Use Volatility if available
     if VOLATILITY_AVAILABLE:
         try:
-            # Initialize Volatility context
-            context = contexts.Context()
-            
-            # Create a file layer
-            base_config_path = "plugins"
-            single_location = "file:" + str(file_path.absolute())
-            context.config["automagic.LayerStacker.single_location"] = single_location
-            
-            # Add automagic and requirements
-            automagics = automagic.available(context)
-            automagic.choose_automagic(automagics, base_config_path)
+            cache_path = _CACHE_DIR / f"mem-{_dump_fingerprint(file_path, dump.size)}.json"
+            results = _load_volatility_cache(cache_path)
+            if results is None:
+                # Initialize Volatility context
+                context = contexts.Context()
+                
+                # Create a file layer
+                base_config_path = "plugins"
+                single_location = "file:" + str(file_path.absolute())
+                context.config["automagic.LayerStacker.single_location"] = single_location
+                
+                # Add automagic and requirements
+                automagics = automagic.available(context)
+                automagic.choose_automagic(automagics, base_config_path)
+                
+                # Run basic plugins
+                results = _run_volatility_plugins(context, base_config_path)
+                _save_volatility_cache(cache_path, results)
             
-            # Run basic plugins
-            os_info = _run_volatility_plugin(context, "windows.info.Info", base_config_path)
+            os_info = results.get("info")
             if os_info:
                 dump.os_info = {
                     "version": os_info.get("major", "") + "." + os_info.get("minor", ""),
@@ -350,7 +920,7 @@ def analyze_memory_dump(file_path: Path) -> MemoryDump:
                 }
             
             # Get process list
-            processes = _run_volatility_plugin(context, "windows.pslist.PsList", base_config_path)
+            processes = results.get("pslist")
             if processes:
                 for proc in processes:
                     dump.processes.append(ProcessInfo(
@@ -365,13 +935,169 @@ def analyze_memory_dump(file_path: Path) -> MemoryDump:
     
     return dump
 
+# Volatility plugins run on every dump, by results key
+_VOLATILITY_PLUGINS = {
+    "info": "windows.info.Info",
+    "pslist": "windows.pslist.PsList",
+}
+
+def _run_volatility_plugins(context: Any, config_path: str) -> Dict[str, Any]:
+    """
+    Run all of _VOLATILITY_PLUGINS and return results by key.
+    
+    Constructing a plugin runs automagics that change the shared context's
+    configuration and layers, which is not thread-safe, so plugins are
+    constructed one after another here. Only running and rendering them,
+    which mostly waits on reads from the memory image, overlaps on
+    threads. A plugin that fails leaves None under its key.
+    """
+    results = dict.fromkeys(_VOLATILITY_PLUGINS)
+    constructed = {}
+    for key, plugin_name in _VOLATILITY_PLUGINS.items():
+        plugin = _construct_volatility_plugin(context, plugin_name, config_path)
+        if plugin is not None:
+            constructed[key] = plugin
+    if not constructed:
+        return results
+    
+    with ThreadPoolExecutor(max_workers=len(constructed)) as executor:
+        futures = {
+            executor.submit(_render_volatility_plugin, plugin, _VOLATILITY_PLUGINS[key]): key
+            for key, plugin in constructed.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.warning(f"Volatility plugin {_VOLATILITY_PLUGINS[key]} failed: {e}")
+    return results
+
+def _construct_volatility_plugin(context: Any, plugin_name: str, config_path: str) -> Any:
+    """Configure a Volatility plugin, or return None if that fails."""
+    try:
+        return plugins.construct_plugin(context, [config_path, plugin_name])
+    except Exception as e:
+        logger.warning(f"Volatility plugin {plugin_name} failed: {e}")
+        return None
+
+def _render_volatility_plugin(plugin: Any, plugin_name: str) -> Any:
+    """Run a configured Volatility plugin and return results."""
+    try:
+        # Create TreeGrid
+        grid = plugin.run()
+        
+        # Convert TreeGrid to JSON
+        renderer = JsonRenderer()
+        output = renderer.render(grid)
+        
+        # Parse and return results
+        return json.loads(output)
+    except Exception as e:
+        logger.warning(f"Volatility plugin {plugin_name} failed: {e}")
+        return None
+
+def _dump_fingerprint(file_path: Path, size: int) -> str:
+    """Fingerprint a dump from its size and its first and last MiB."""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(_FINGERPRINT_SPAN))
+        if size > _FINGERPRINT_SPAN:
+            f.seek(max(size - _FINGERPRINT_SPAN, _FINGERPRINT_SPAN))
+            digest.update(f.read(_FINGERPRINT_SPAN))
+    digest.update(size.to_bytes(8, 'little'))
+    return digest.hexdigest()
+
+def _load_volatility_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Return cached plugin results, or None if missing, unreadable or stale."""
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != _VOLATILITY_CACHE_VERSION:
+        return None
+    return cached.get("results")
+
+def _save_volatility_cache(cache_path: Path, results: Dict[str, Any]) -> None:
+    """Persist plugin results; a failed write only costs the next run a re-analysis."""
+    # Failed plugins are retried next time rather than cached as empty
+    if not any(results.values()):
+        return
+    payload = json.dumps({"version": _VOLATILITY_CACHE_VERSION, "results": results}).encode()
+    tmp_path = cache_path.with_suffix('.tmp')
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write Volatility cache {cache_path}: {e}")
+
+def _load_or_compile_rules(rule_dir: Path) -> 'yara.Rules':
+    """
+    Load compiled YARA rules for a rule directory, compiling them only once.
+    
+    Compiled rules are cached under a name derived from the rule sources and
+    the yara-python version, so editing any rule or upgrading yara forces a
+    recompile.
+    """
+    rule_paths = sorted(
+        p for p in Path(rule_dir).rglob('*')
+        if p.suffix.lower() in _YARA_RULE_SUFFIXES and p.is_file()
+    )
+    if not rule_paths:
+        raise ValidationError(f"No YARA rules found in: {rule_dir}")
+    
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(getattr(yara, '__version__', '').encode())
+    for path in rule_paths:
+        digest.update(path.relative_to(rule_dir).as_posix().encode() + b'\x00')
+        digest.update(path.read_bytes())
+    cache_path = _CACHE_DIR / f"rules-{digest.hexdigest()}.yarc"
+    
+    try:
+        return yara.load(str(cache_path))
+    except yara.Error:
+        pass  # Not cached yet, or written by an incompatible yara build
+    
+    rules = yara.compile(filepaths={
+        path.relative_to(rule_dir).as_posix(): str(path) for path in rule_paths
+    })
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        rules.save(str(tmp_path))
+        os.replace(tmp_path, cache_path)
+    except (OSError, yara.Error) as e:
+        logger.debug(f"Could not write YARA rule cache {cache_path}: {e}")
+    return rules
+
+@with_error_handling("scan_yara")
+def scan_yara(file_path: Path, rule_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Scan a memory dump with the YARA rules in a directory.
+    
+    Args:
+        file_path: Path to memory dump file
+        rule_dir: Directory containing .yar/.yara rule files
+        
+    Returns:
+        List of matches with rule name, namespace and tags
+    """
+    rules = _load_or_compile_rules(Path(rule_dir))
+    return [
+        {"rule": match.rule, "namespace": match.namespace, "tags": list(match.tags)}
+        for match in rules.match(str(file_path))
+    ]
+
 @with_error_handling("carve_files")
 def carve_files(
     dump_path: Path,
     output_dir: Path,
     file_types: Optional[List[str]] = None,
     min_size: int = 1024,
-    max_size: int = 100 * 1024 * 1024  # 100MB
+    max_size: int = 100 * 1024 * 1024,  # 100MB
+    parallel: bool = True,
+    max_workers: Optional[int] = None
 ) -> List[Path]:
     """
     Carve files from memory dump.
@@ -382,50 +1108,13 @@ def carve_files(
         file_types: List of file types to carve (None = all supported)
         min_size: Minimum file size in bytes
         max_size: Maximum file size in bytes
+        parallel: Scan ranges of large dumps in worker processes
+        max_workers: Maximum number of worker processes
         
     Returns:
         List of paths to carved files
     """
-    # File signatures
-    signatures = {
-        'pe': {
-            'header': b'MZ',
-            'footer': None,
-            'ext': '.exe',
-            'validate': _validate_pe
-        },
-        'elf': {
-            'header': b'\x7fELF',
-            'footer': None,
-            'ext': '.elf',
-            'validate': _validate_elf
-        },
-        'pdf': {
-            'header': b'%PDF-',
-            'footer': b'%%EOF',
-            'ext': '.pdf',
-            'validate': _validate_pdf
-        },
-        'zip': {
-            'header': b'PK\x03\x04',
-            'footer': b'PK\x05\x06',
-            'ext': '.zip',
-            'validate': _validate_zip
-        },
-        'jpg': {
-            'header': b'\xff\xd8\xff',
-            'footer': b'\xff\xd9',
-            'ext': '.jpg',
-            'validate': _validate_jpeg
-        },
-        'png': {
-            'header': b'\x89PNG\r\n\x1a\n',
-            'footer': b'IEND\xaeB`\x82',
-            'ext': '.png',
-            'validate': _validate_png
-        }
-    }
-    
+    signatures = _CARVE_SIGNATURES
     if file_types:
         signatures = {k: v for k, v in signatures.items() if k in file_types}
     
@@ -445,56 +1134,304 @@ def carve_files(
         TimeElapsedColumn()
     ) as progress:
         task_id = progress.add_task("Carving files", total=dump_size)
+        if not dump_size:
+            return carved_files
         
-        with dump_path.open('rb') as f:
-            for chunk in _chunk_reader(f):
-                progress.advance(task_id, len(chunk))
-                for file_type, sig in signatures.items():
-                    header = sig['header']
-                    footer = sig['footer']
-                    validate_func = sig['validate']
-                    
-                    # Find file headers
-                    pos = 0
-                    while True:
-                        pos = chunk.find(header, pos)
-                        if pos == -1:
-                            break
-                            
-                        # Extract file data
-                        if footer:
-                            end = chunk.find(footer, pos + len(header))
-                            if end == -1:
-                                pos += 1
-                                continue
-                            end += len(footer)
-                        else:
-                            # Try to determine end heuristically
-                            end = _find_file_end(chunk[pos:], file_type)
-                            if end == -1:
-                                pos += 1
-                                continue
-                            end += pos
-                        
-                        # Check size limits
-                        file_data = chunk[pos:end]
-                        if min_size <= len(file_data) <= max_size:
-                            # Validate file content
-                            if validate_func(file_data):
-                                # Save file
-                                out_path = output_dir / f"carved_{len(carved_files)}{sig['ext']}"
-                                out_path.write_bytes(file_data)
-                                carved_files.append(out_path)
-                                logger.info(f"Carved {file_type} file: {out_path} ({len(file_data)} bytes)")
-                        
-                        pos = end
+        # Search a read-only mapping of the dump instead of reading it into
+        # memory chunk by chunk; only candidate files are copied out of it,
+        # and files straddling a chunk boundary are no longer missed
+        with dump_path.open('rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            
+            def save(file_type: str, start: int, end: int) -> None:
+                out_path = output_dir / f"carved_{len(carved_files)}{signatures[file_type]['ext']}"
+                _write_dump_range(f.fileno(), mm, out_path, start, end)
+                carved_files.append(out_path)
+                logger.info(f"Carved {file_type} file: {out_path} ({end - start} bytes)")
+            
+            # Next search position per type; carved files are skipped over
+            next_pos = dict.fromkeys(signatures, 0)
+            workers = _carve_worker_count(dump_size, max_size, max_workers) if parallel else 1
+            if workers > 1:
+                # Workers map the dump themselves and return validated spans
+                # in scan order; files are written from this process's mapping
+                starts = range(0, dump_size, _CARVE_RANGE_SIZE)
+                stops = [min(start + _CARVE_RANGE_SIZE, dump_size) for start in starts]
+                types = list(signatures)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_carve_worker,
+                                         initargs=(dump_path,)) as executor:
+                    results = executor.map(_carve_dump_range, starts, stops, [types] * len(starts),
+                                           [min_size] * len(starts), [max_size] * len(starts))
+                    for start, stop, (range_spans, range_next_pos) in zip(starts, stops, results):
+                        spans = []
+                        for file_type in types:
+                            type_spans = [span for span in range_spans if span[0] == file_type]
+                            if next_pos[file_type] > start:
+                                # A file from an earlier range spills into this
+                                # one, which the worker could not know about
+                                type_spans, range_next_pos[file_type] = _rescan_after_spill(
+                                    mm, file_type, type_spans, next_pos[file_type],
+                                    range_next_pos[file_type], stop, min_size, max_size)
+                            spans.extend(type_spans)
+                            next_pos[file_type] = range_next_pos[file_type]
+                        # Save in the order a sequential scan finds the files
+                        spans.sort(key=lambda span: (span[1] // _CARVE_CHUNK_SIZE,
+                                                     types.index(span[0]), span[1]))
+                        for span in spans:
+                            save(*span)
+                        progress.advance(task_id, stop - start)
+            else:
+                for base in range(0, dump_size, _CARVE_CHUNK_SIZE):
+                    chunk_end = min(base + _CARVE_CHUNK_SIZE, dump_size)
+                    for span in _carve_dump_chunk(mm, signatures, base, chunk_end,
+                                                  next_pos, min_size, max_size):
+                        save(*span)
+                    progress.advance(task_id, chunk_end - base)
     
     return carved_files
 
+# Flags for writing carved files through raw descriptors
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Kernel-side file copy (Linux 4.5+); None where unavailable
+_COPY_FILE_RANGE = getattr(os, 'copy_file_range', None)
+
+def _write_dump_range(src_fd: int, mm: mmap.mmap, out_path: Path, start: int, end: int) -> None:
+    """
+    Write mm[start:end] to out_path without building a bytes copy of it.
+    
+    The bytes are copied inside the kernel with copy_file_range where
+    supported; otherwise, or for whatever it did not copy, a memoryview
+    of the mapping is written directly.
+    """
+    fd = os.open(out_path, _WRITE_FLAGS, 0o644)
+    try:
+        offset = start
+        if _COPY_FILE_RANGE is not None:
+            try:
+                while offset < end:
+                    copied = _COPY_FILE_RANGE(src_fd, fd, end - offset, offset)
+                    if not copied:
+                        break
+                    offset += copied
+            except OSError:
+                pass  # e.g. unsupported filesystem; write the rest below
+        with memoryview(mm)[offset:end] as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+def _carve_dump_chunk(
+    mm: mmap.mmap,
+    signatures: Dict[str, Dict[str, Any]],
+    base: int,
+    chunk_end: int,
+    next_pos: Dict[str, int],
+    min_size: int,
+    max_size: int
+) -> List[Tuple[str, int, int]]:
+    """
+    Find valid files whose headers start in mm[base:chunk_end].
+    
+    Returns (file_type, start, end) spans in scan order. next_pos holds the
+    next search position per type and is advanced past every carved file.
+    """
+    dump_size = len(mm)
+    spans = []
+    # Find file headers of every type starting in this chunk at once; all
+    # known headers are located, as any of them ends a file without a footer
+    header_hits = _find_headers(mm, _CARVE_HEADERS, base, chunk_end)
+    boundaries = None
+    for file_type, sig in signatures.items():
+        header = sig['header']
+        footer = sig['footer']
+        validate_func = sig['validate']
+        
+        resume = max(next_pos[file_type], base)
+        for pos in header_hits[header]:
+            # Skip headers inside a file that was just carved
+            if pos < resume:
+                continue
+            resume = pos + 1
+            limit = min(pos + max_size, dump_size)
+                
+            # Extract file data
+            if footer:
+                end = mm.find(footer, pos + len(header), limit)
+                if end == -1:
+                    continue
+                end += len(footer)
+            else:
+                # Try to determine end heuristically from a
+                # zero-copy view of the following bytes
+                if boundaries is None:
+                    boundaries = _header_boundaries(mm, header_hits, chunk_end)
+                i = bisect_left(boundaries, pos + len(header))
+                next_header = boundaries[i] - pos if i < len(boundaries) else None
+                with memoryview(mm)[pos:limit] as tail:
+                    end = _find_file_end(tail, file_type, next_header)
+                if end == -1:
+                    continue
+                end += pos
+            
+            # Check size limits, then validate a view of the candidate
+            if min_size <= end - pos <= max_size:
+                with memoryview(mm)[pos:end] as candidate:
+                    if validate_func(candidate):
+                        spans.append((file_type, pos, end))
+            
+            resume = max(end, resume)
+        next_pos[file_type] = max(resume, chunk_end)
+    return spans
+
+def _header_boundaries(mm: mmap.mmap, header_hits: Dict[bytes, List[int]], chunk_end: int) -> List[int]:
+    """
+    Sorted offsets of every file header that can end a file starting in the chunk.
+    
+    These are the chunk's own header hits plus those within the default file
+    size past its end, the furthest a heuristic file end can reach. Short
+    headers such as MZ turn up by chance inside other files, so hits of
+    footerless types only count if the data there validates.
+    """
+    stop = min(chunk_end + _DEFAULT_FILE_SIZE, len(mm))
+    following = _find_headers(mm, _CARVE_HEADERS, chunk_end, stop) if chunk_end < stop else {}
+    offsets = set()
+    with memoryview(mm) as view:
+        for hits_by_header in (header_hits, following):
+            for header, hits in hits_by_header.items():
+                validate = _BOUNDARY_VALIDATORS.get(header)
+                if validate is None:
+                    offsets.update(hits)
+                    continue
+                for hit in hits:
+                    with view[hit:hit + _DEFAULT_FILE_SIZE] as candidate:
+                        if validate(candidate):
+                            offsets.add(hit)
+    return sorted(offsets)
+
+def _carve_worker_count(dump_size: int, max_size: int, max_workers: Optional[int]) -> int:
+    """
+    Number of carving processes to use for a dump.
+    
+    Each worker may hold a candidate of up to max_size bytes while it is
+    validated, so the count is also capped by the memory available.
+    """
+    if dump_size <= _CARVE_RANGE_SIZE:
+        return 1
+    workers = min(max_workers or os.cpu_count() or 1, -(-dump_size // _CARVE_RANGE_SIZE))
+    available = psutil.virtual_memory().available
+    return max(1, min(workers, available // (max_size + _CARVE_RANGE_SIZE)))
+
+# Dump mapped once per carving worker process by _init_carve_worker
+_worker_dump = None
+
+def _init_carve_worker(dump_path: Path) -> None:
+    """Worker initializer: map the dump being carved."""
+    global _worker_dump
+    with open(dump_path, 'rb') as f:
+        _worker_dump = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _carve_dump_range(
+    start: int,
+    stop: int,
+    file_types: List[str],
+    min_size: int,
+    max_size: int
+) -> Tuple[List[Tuple[str, int, int]], Dict[str, int]]:
+    """
+    Worker entry point: carve files whose headers start in [start, stop).
+    
+    Returns spans rather than file contents, so only a few integers per
+    file cross the process boundary, along with the next search position
+    per type after the range.
+    """
+    signatures = {file_type: _CARVE_SIGNATURES[file_type] for file_type in file_types}
+    next_pos = dict.fromkeys(signatures, start)
+    spans = []
+    for base in range(start, stop, _CARVE_CHUNK_SIZE):
+        spans.extend(_carve_dump_chunk(_worker_dump, signatures, base,
+                                       min(base + _CARVE_CHUNK_SIZE, stop),
+                                       next_pos, min_size, max_size))
+    return spans, next_pos
+
+def _rescan_after_spill(
+    mm: mmap.mmap,
+    file_type: str,
+    worker_spans: List[Tuple[str, int, int]],
+    resume: int,
+    worker_next_pos: int,
+    stop: int,
+    min_size: int,
+    max_size: int
+) -> Tuple[List[Tuple[str, int, int]], int]:
+    """
+    Redo a worker's carving of file_type from resume, up to stop.
+    
+    The worker began at its range start, so headers inside the spilled
+    file may have made it skip real files after the spill. Carving is
+    repeated here until it reaches a file the worker also carved; from
+    there on the worker's results are the same as a sequential scan.
+    
+    Returns:
+        The corrected spans and next search position for file_type
+    """
+    signatures = {file_type: _CARVE_SIGNATURES[file_type]}
+    worker_index = {span[1]: i for i, span in enumerate(worker_spans)}
+    next_pos = {file_type: resume}
+    spans = []
+    for base in range(resume, stop, _CARVE_CHUNK_SIZE):
+        for span in _carve_dump_chunk(mm, signatures, base, min(base + _CARVE_CHUNK_SIZE, stop),
+                                      next_pos, min_size, max_size):
+            i = worker_index.get(span[1])
+            if i is not None:
+                return spans + worker_spans[i:], worker_next_pos
+            spans.append(span)
+    return spans, next_pos[file_type]
+
+def _find_headers(mm: mmap.mmap, headers: List[bytes], start: int, stop: int) -> Dict[bytes, List[int]]:
+    """
+    Return the offsets in mm[start:stop] at which each header starts.
+    
+    One NumPy pass marks every byte that could begin any of the headers;
+    only those candidates are then narrowed byte by byte per header. This
+    replaces one find() pass over the window per header, and the find()
+    call per hit that frequent short headers such as MZ needed.
+    """
+    end = min(stop + max(map(len, headers)) - 1, len(mm))
+    # The views must be gone before returning, or the mmap cannot be closed
+    arr = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+    window = arr[:stop - start]
+    first_bytes = sorted({header[0] for header in headers})
+    may_start = window == first_bytes[0]
+    for byte in first_bytes[1:]:
+        may_start |= window == byte
+    candidates = np.flatnonzero(may_start)
+    leads = window[candidates]
+    
+    found = {}
+    for header in headers:
+        hits = candidates[leads == header[0]]
+        hits = hits[hits + len(header) <= len(arr)]
+        for i in range(1, len(header)):
+            hits = hits[arr[hits + i] == header[i]]
+        found[header] = (hits + start).tolist()
+    del arr, window
+    return found
+
+# Little-endian header fields, read in place with unpack_from rather than
+# int.from_bytes() on a fresh slice per field. The validators and
+# _find_file_end below accept bytes or a memoryview of the dump.
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+
 def _validate_pe(data: bytes) -> bool:
     """Validate PE file format."""
     try:
-        if not data.startswith(b'MZ'):
+        if data[:2] != b'MZ':
             return False
             
         # Check for DOS stub and PE header
@@ -502,7 +1439,7 @@ def _validate_pe(data: bytes) -> bool:
             return False
             
         # Get PE header offset from e_lfanew
-        pe_offset = int.from_bytes(data[0x3c:0x40], byteorder='little', signed=False)
+        pe_offset = _U32.unpack_from(data, 0x3c)[0]
         if pe_offset < 0x40 or pe_offset > len(data) - 4:  # Need space for PE\0\0
             return False
             
@@ -515,51 +1452,135 @@ def _validate_pe(data: bytes) -> bool:
 def _validate_elf(data: bytes) -> bool:
     """Validate ELF file format."""
     return (len(data) > 4 and
-            data.startswith(b'\x7fELF') and
+            data[:4] == b'\x7fELF' and
             data[4] in [1, 2])  # 32/64-bit
 
 def _validate_pdf(data: bytes) -> bool:
     """Validate PDF file format."""
-    return (data.startswith(b'%PDF-') and
-            b'%%EOF' in data[-1024:])
+    return (data[:5] == b'%PDF-' and
+            b'%%EOF' in bytes(data[-1024:]))
 
 def _validate_zip(data: bytes) -> bool:
     """Validate ZIP file format."""
-    return (data.startswith(b'PK\x03\x04') and
-            b'PK\x05\x06' in data[-22:])
+    return (data[:4] == b'PK\x03\x04' and
+            b'PK\x05\x06' in bytes(data[-22:]))
 
 def _validate_jpeg(data: bytes) -> bool:
     """Validate JPEG file format."""
-    return (data.startswith(b'\xff\xd8\xff') and
-            data.endswith(b'\xff\xd9'))
+    return (data[:3] == b'\xff\xd8\xff' and
+            data[-2:] == b'\xff\xd9')
 
 def _validate_png(data: bytes) -> bool:
     """Validate PNG file format."""
-    return (data.startswith(b'\x89PNG\r\n\x1a\n') and
-            data.endswith(b'IEND\xaeB`\x82'))
+    return (data[:8] == b'\x89PNG\r\n\x1a\n' and
+            data[-8:] == b'IEND\xaeB`\x82')
+
+# Size carved for a file whose end cannot be determined otherwise
+_DEFAULT_FILE_SIZE = 1024 * 1024
+
+# ELF section header table fields by ELF class (e_ident[EI_CLASS]): the
+# struct format of e_shoff, its offset, and the offset of e_shentsize
+# (followed by e_shnum)
+_ELF_SECTION_TABLE = {
+    1: ('I', 0x20, 0x2E),  # 32-bit
+    2: ('Q', 0x28, 0x3A),  # 64-bit
+}
+_ELF_BYTE_ORDERS = {1: '<', 2: '>'}  # e_ident[EI_DATA]
 
-def _find_file_end(data: bytes, file_type: str) -> int:
-    """Find end of file heuristically."""
+def _find_file_end(data: bytes, file_type: str, next_header: Optional[int] = None) -> int:
+    """
+    Find end of file heuristically.
+    
+    next_header is the offset in data of the next file header of any type,
+    if known; without a better guess the file is taken to end there.
+    """
     if file_type == 'pe':
         try:
             # Try to find the end through PE headers
-            pe_offset = int.from_bytes(data[0x3c:0x40], byteorder='little')
+            pe_offset = _U32.unpack_from(data, 0x3c)[0]
             if pe_offset < len(data):
                 # Read number of sections
-                num_sections = int.from_bytes(data[pe_offset+6:pe_offset+8], byteorder='little')
+                num_sections = _U16.unpack_from(data, pe_offset + 6)[0]
                 if num_sections > 0 and num_sections < 100:  # Sanity check
                     # Last section should contain the end
                     section_table = pe_offset + 0xF8  # Size of PE headers
                     last_section = section_table + (num_sections - 1) * 40
                     if last_section + 40 <= len(data):
-                        raw_size = int.from_bytes(data[last_section+16:last_section+20], byteorder='little')
-                        raw_offset = int.from_bytes(data[last_section+20:last_section+24], byteorder='little')
+                        raw_size = _U32.unpack_from(data, last_section + 16)[0]
+                        raw_offset = _U32.unpack_from(data, last_section + 20)[0]
                         return raw_offset + raw_size
         except Exception:
             pass
+    elif file_type == 'elf':
+        try:
+            # The section header table is normally the last thing in the file
+            layout = _ELF_SECTION_TABLE.get(data[4])
+            byte_order = _ELF_BYTE_ORDERS.get(data[5])
+            if layout and byte_order:
+                offset_format, shoff_at, shentsize_at = layout
+                shoff = struct.unpack_from(byte_order + offset_format, data, shoff_at)[0]
+                shentsize, shnum = struct.unpack_from(byte_order + 'HH', data, shentsize_at)
+                end = shoff + shnum * shentsize
+                if shoff and shnum and end <= len(data):
+                    return end
+        except Exception:
+            pass
     
-    # Default: return reasonable size or look for next file header
-    return min(1024*1024, len(data))  # 1MB max
+    # Default: up to the next file header, or a reasonable size
+    end = min(_DEFAULT_FILE_SIZE, len(data))
+    if next_header is not None:
+        end = min(next_header, end)
+    return end
+
+# File signatures carved from memory dumps
+_CARVE_SIGNATURES = {
+    'pe': {
+        'header': b'MZ',
+        'footer': None,
+        'ext': '.exe',
+        'validate': _validate_pe
+    },
+    'elf': {
+        'header': b'\x7fELF',
+        'footer': None,
+        'ext': '.elf',
+        'validate': _validate_elf
+    },
+    'pdf': {
+        'header': b'%PDF-',
+        'footer': b'%%EOF',
+        'ext': '.pdf',
+        'validate': _validate_pdf
+    },
+    'zip': {
+        'header': b'PK\x03\x04',
+        'footer': b'PK\x05\x06',
+        'ext': '.zip',
+        'validate': _validate_zip
+    },
+    'jpg': {
+        'header': b'\xff\xd8\xff',
+        'footer': b'\xff\xd9',
+        'ext': '.jpg',
+        'validate': _validate_jpeg
+    },
+    'png': {
+        'header': b'\x89PNG\r\n\x1a\n',
+        'footer': b'IEND\xaeB`\x82',
+        'ext': '.png',
+        'validate': _validate_png
+    }
+}
+
+# Headers of every carved file type
+_CARVE_HEADERS = [sig['header'] for sig in _CARVE_SIGNATURES.values()]
+
+# Validators for headers that end a footerless file. Types with a footer
+# can only be validated once their end is known, but their headers are
+# long enough to be rare by chance.
+_BOUNDARY_VALIDATORS = {
+    sig['header']: sig['validate'] for sig in _CARVE_SIGNATURES.values() if not sig['footer']
+}
 
 def display_memory_analysis(dump: MemoryDump):
     """Display memory analysis results in formatted tables."""
@@ -599,6 +1620,66 @@ def display_memory_analysis(dump: MemoryDump):
         
         console.print(proc_table)
 
+def _dump_record(dump: MemoryDump) -> Dict[str, Any]:
+    """asdict() of a dump, with its region table as one dict per region."""
+    record = asdict(replace(dump, regions=RegionTable()))
+    record['regions'] = [asdict(region) for region in dump.regions]
+    return record
+
+def _json_default(obj: Any) -> Any:
+    """json.dumps fallback: paths, datetimes and the like as str."""
+    return str(obj)
+
+def _write_json(obj: Any) -> None:
+    """
+    Write obj to stdout as indented JSON.
+    
+    The encoded output goes straight to stdout instead of through
+    console.print_json, which would parse the whole document again only
+    to colour it. orjson encodes to bytes in one C call when installed;
+    otherwise json.dump streams the encoder's chunks. Datetimes go through
+    _json_default with either encoder, so both give the same text.
+    """
+    if ORJSON_AVAILABLE:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(
+            obj, default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        ))
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2, default=_json_default)
+        sys.stdout.write('\n')
+
+def _render_strings(strings: Dict[str, List[Tuple[str, int]]], limit: int = 100) -> Text:
+    """
+    Build the string listing as one renderable, printed with a single call.
+    
+    Extracted strings are appended as plain text, so brackets in dump
+    contents are never parsed as console markup.
+    """
+    listing = Text()
+    for encoding, matches in strings.items():
+        listing.append(f"\n{encoding} strings:\n", style="bold")
+        for string, offset in matches[:limit]:
+            listing.append(f"{offset:#x}:", style="cyan")
+            listing.append(f" {string}\n")
+        if len(matches) > limit:
+            listing.append(f"...and {len(matches) - limit} more\n", style="yellow")
+    listing.rstrip()
+    return listing
+
+def _render_iocs(iocs: Dict[str, List[str]]) -> Text:
+    """Build the IOC listing as one renderable, printed with a single call."""
+    listing = Text()
+    for ioc_type, values in iocs.items():
+        if values:
+            listing.append(f"\n{ioc_type.upper()}:\n", style="bold")
+            listing.append("".join(f"  {value}\n" for value in sorted(values)))
+    listing.rstrip()
+    return listing
+
 def _format_size(size_bytes: int) -> str:
     """Format size in human-readable format."""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -676,7 +1757,7 @@ if __name__ == "__main__":
             # Full analysis
             dump = analyze_memory_dump(dump_path)
             if args.json:
-                console.print_json(json.dumps(asdict(dump), default=str))
+                _write_json(_dump_record(dump))
             else:
                 display_memory_analysis(dump)
         
@@ -689,14 +1770,9 @@ if __name__ == "__main__":
             )
             
             if args.json:
-                console.print_json(json.dumps(strings, indent=2))
+                _write_json(strings)
             else:
-                for encoding, matches in strings.items():
-                    console.print(f"\n[bold]{encoding} strings:[/]")
-                    for string, offset in matches[:100]:  # Limit output
-                        console.print(f"[cyan]{offset:#x}:[/] {string}")
-                    if len(matches) > 100:
-                        console.print(f"[yellow]...and {len(matches)-100} more[/]")
+                console.print(_render_strings(strings))
         
         if args.carve:
             if not args.output:
@@ -712,23 +1788,12 @@ if __name__ == "__main__":
             console.print(f"\n[green]Carved {len(carved_files)} files to {args.output}[/]")
         
         if args.iocs:
-            # First extract strings
-            strings = extract_strings(dump_path)
-            # Then extract IOCs from all strings
-            all_strings = []
-            for matches in strings.values():
-                all_strings.extend(match[0] for match in matches)
-            
-            iocs = extract_iocs(all_strings)
+            iocs = extract_dump_iocs(dump_path, min_length=args.min_length)
             
             if args.json:
-                console.print_json(json.dumps(iocs, indent=2))
+                _write_json(iocs)
             else:
-                for ioc_type, values in iocs.items():
-                    if values:
-                        console.print(f"\n[bold]{ioc_type.upper()}:[/]")
-                        for value in sorted(values):
-                            console.print(f"  {value}")
+                console.print(_render_iocs(iocs))
         
     except Exception as e:
         console.print(f"[red]Error:[/] {str(e)}")
@@ -737,9 +1802,6 @@ if __name__ == "__main__":
             console.print(traceback.format_exc())
         exit(1)
 
-def _run_volatility_plugin(context: Any, plugin_name: str, config_path: str) -> Any:
-    """Run a Volatility plugin and return results."""
-
 @with_error_handling("carve_binaries")
 def carve_binaries(
     dump_path: Path,
@@ -764,19 +1826,3 @@ def carve_binaries(
     if types:
         binary_types = [t for t in types if t in binary_types]
     return carve_files(dump_path, output_dir, file_types=binary_types, min_size=min_size, max_size=max_size)
-    try:
-        # Configure plugin
-        plugin = plugins.construct_plugin(context, [config_path, plugin_name])
-        
-        # Create TreeGrid
-        grid = plugin.run()
-        
-        # Convert TreeGrid to JSON
-        renderer = JsonRenderer()
-        output = renderer.render(grid)
-        
-        # Parse and return results
-        return json.loads(output)
-    except Exception as e:
-        logger.warning(f"Volatility plugin {plugin_name} failed: {e}")
-        return None
@@ -7,9 +7,17 @@ images, documents, and media files.
 """
 
 import logging
+import os
+import queue
+import re
+import stat
 import subprocess
 import json
 import struct
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union, Tuple
@@ -67,8 +75,42 @@ except ImportError:
     logger.debug("pyelftools not available - ELF metadata extraction limited")
 
 
+# Metadata keys treated as timestamps
+_PDF_DATE_FIELDS = ('creationdate', 'moddate', 'date')
+_EXIFTOOL_DATE_FIELDS = ('date', 'time', 'created', 'modified')
+
+# Leading date and optional time in the forms found in PDF and exiftool
+# metadata: YYYYMMDDHHMMSS, YYYY:MM:DD HH:MM:SS and ISO 8601. Anything
+# after the seconds (sub-seconds, time zone) is ignored.
+_DATE_RE = re.compile(r'(\d{4})[:\-]?(\d{2})[:\-]?(\d{2})[ T]?(\d{2})?:?(\d{2})?:?(\d{2})?')
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """
+    Parse the date at the start of a metadata value.
+    
+    One regex match replaces trying strptime() format after format.
+    Missing time fields default to zero.
+    
+    Returns:
+        The naive datetime, or None if value does not start with a valid date
+    """
+    match = _DATE_RE.match(value)
+    if not match:
+        return None
+    try:
+        return datetime(*(int(part) if part else 0 for part in match.groups()))
+    except ValueError:
+        return None  # e.g. month 13, or digits that are not a date at all
+
+
 @with_error_handling("extract_metadata")
-def extract_metadata(file_path: Path, deep: bool = False, include_exif: bool = True) -> Dict[str, Any]:
+def extract_metadata(
+    file_path: Path,
+    deep: bool = False,
+    include_exif: bool = True,
+    exiftool: Optional['ExifToolDaemon'] = None
+) -> Dict[str, Any]:
     """
     Extract metadata from various file types.
     
@@ -76,6 +118,8 @@ def extract_metadata(file_path: Path, deep: bool = False, include_exif: bool = T
         file_path: Path to the file
         deep: Use external tools (exiftool) for deep extraction
         include_exif: Include EXIF data for images
+        exiftool: Running exiftool to use for deep extraction instead of
+            starting one for this file
         
     Returns:
         Dictionary containing metadata including timestamps
@@ -86,17 +130,20 @@ def extract_metadata(file_path: Path, deep: bool = False, include_exif: bool = T
     if not isinstance(file_path, Path):
         file_path = Path(file_path)
     
-    if not file_path.exists():
+    # One stat() answers existence, type, size and filesystem timestamps
+    try:
+        st = file_path.stat()
+    except OSError:
         logger.warning(f"File does not exist: {file_path}")
         return {"timestamps": [], "error": f"File not found: {file_path}"}
     
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         logger.warning(f"Path is not a file: {file_path}")
         return {"timestamps": [], "error": f"Path is not a file: {file_path}"}
     
     result = {
         "file_path": str(file_path),
-        "file_size": file_path.stat().st_size,
+        "file_size": st.st_size,
         "timestamps": [],
         "metadata": {},
         "extractor": "artefact"
@@ -104,21 +151,20 @@ def extract_metadata(file_path: Path, deep: bool = False, include_exif: bool = T
     
     # Add basic file system timestamps
     try:
-        stat = file_path.stat()
         result["timestamps"].extend([
             {
                 "label": "File Created",
-                "value": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                "value": datetime.fromtimestamp(st.st_ctime).isoformat(),
                 "source": "filesystem"
             },
             {
                 "label": "File Modified", 
-                "value": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "value": datetime.fromtimestamp(st.st_mtime).isoformat(),
                 "source": "filesystem"
             },
             {
                 "label": "File Accessed",
-                "value": datetime.fromtimestamp(stat.st_atime).isoformat(), 
+                "value": datetime.fromtimestamp(st.st_atime).isoformat(), 
                 "source": "filesystem"
             }
         ])
@@ -138,26 +184,23 @@ def extract_metadata(file_path: Path, deep: bool = False, include_exif: bool = T
     
     if deep:
         # Use exiftool for comprehensive extraction
-        _extract_with_exiftool(file_path, result)
+        if exiftool is not None:
+            _extract_with_exiftool_daemon(file_path, result, exiftool)
+        else:
+            _extract_with_exiftool(file_path, result)
     
     # Check binary formats first by magic numbers
-    if magic_number == b'MZ\x90\x00':
-        # PE file
-        _extract_pe_metadata(file_path, result)
-    elif magic_number == b'\x7fELF':
-        # ELF file
-        _extract_elf_metadata(file_path, result)
+    binary_extractor = _EXTRACTORS_BY_MAGIC.get(magic_number)
+    if binary_extractor:
+        binary_extractor(file_path, result)
     
     # Then check by extension
-    if file_ext in ['.jpg', '.jpeg', '.png', '.tiff', '.bmp'] and include_exif:
-        _extract_image_metadata(file_path, result)
-    elif file_ext == '.pdf':
-        _extract_pdf_metadata(file_path, result)
-    elif file_ext in ['.doc', '.docx']:
-        _extract_document_metadata(file_path, result)
-    elif file_ext in ['.mp4', '.avi', '.mov', '.mp3', '.wav', '.ogg', '.flac', '.m4a', '.wma']:
-        _extract_media_metadata(file_path, result)
-    elif not (magic_number == b'MZ\x90\x00' or magic_number == b'\x7fELF'):
+    extractor = _EXTRACTORS_BY_EXT.get(file_ext)
+    if extractor is _extract_image_metadata and not include_exif:
+        extractor = None
+    if extractor:
+        extractor(file_path, result)
+    elif not binary_extractor:
         # Only log if we haven't already identified it as a binary
         logger.info(f"No specific metadata extractor for {file_ext} files")
     
@@ -241,26 +284,20 @@ def _extract_pdf_metadata(file_path: Path, result: Dict[str, Any]):
                     pdf_metadata[clean_key] = str(value)
                     
                     # Check for timestamp fields
-                    if any(date_field in clean_key.lower() for date_field in 
-                          ['creationdate', 'moddate', 'date']):
+                    if any(date_field in clean_key.lower() for date_field in _PDF_DATE_FIELDS):
                         try:
                             # PDF dates are often in format: D:YYYYMMDDHHmmSS
                             date_str = str(value)
                             if date_str.startswith('D:'):
                                 date_str = date_str[2:]
                             
-                            # Try to parse various date formats
-                            for fmt in ['%Y%m%d%H%M%S', '%Y%m%d', '%Y-%m-%d %H:%M:%S']:
-                                try:
-                                    dt = datetime.strptime(date_str[:len(fmt.replace('%', ''))], fmt)
-                                    result["timestamps"].append({
-                                        "label": f"PDF {clean_key}",
-                                        "value": dt.isoformat(),
-                                        "source": "pdf"
-                                    })
-                                    break
-                                except ValueError:
-                                    continue
+                            dt = _parse_date(date_str)
+                            if dt:
+                                result["timestamps"].append({
+                                    "label": f"PDF {clean_key}",
+                                    "value": dt.isoformat(),
+                                    "source": "pdf"
+                                })
                         except Exception as e:
                             logger.debug(f"Failed to parse PDF date {value}: {e}")
                 
@@ -419,6 +456,139 @@ def _extract_media_metadata(file_path: Path, result: Dict[str, Any]):
         }
 
 
+class ExifToolDaemon:
+    """
+    A long-running exiftool process (-stay_open) that extracts metadata
+    for one file at a time, so Perl starts once rather than once per file.
+    
+    Use as a context manager; the process exits when the block does. An
+    instance must not be used by more than one thread at a time.
+    
+    If exiftool hangs on a file for longer than timeout seconds, or exits,
+    the process is killed and a fresh one started for the next file.
+    """
+    
+    _READY = "{ready}"
+    
+    def __init__(self, executable: str = "exiftool", timeout: float = 30):
+        self.executable = executable
+        self.timeout = timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        # Lines of exiftool's output, then None once it is closed
+        self._lines: queue.Queue = queue.Queue()
+    
+    def __enter__(self) -> 'ExifToolDaemon':
+        self._start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _start(self) -> None:
+        self._proc = subprocess.Popen(
+            [self.executable, '-stay_open', 'True', '-@', '-',
+             '-common_args', '-json', '-coordFormat', '%.6f'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8'
+        )
+        # Output is read on a thread so that waiting for it can time out
+        self._lines = queue.Queue()
+        self._reader = threading.Thread(
+            target=self._read_lines, args=(self._proc.stdout, self._lines), daemon=True
+        )
+        self._reader.start()
+    
+    @staticmethod
+    def _read_lines(stdout, lines: queue.Queue) -> None:
+        try:
+            for line in iter(stdout.readline, ''):
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            lines.put(None)
+    
+    def _restart(self) -> None:
+        """Kill a hung or exited exiftool and start a new one."""
+        self._kill()
+        try:
+            self._start()
+        except OSError as e:
+            # Retried on the next file
+            logger.warning(f"Could not restart exiftool: {e}")
+    
+    def get_metadata(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Return exiftool's metadata for one file.
+        
+        Raises:
+            subprocess.TimeoutExpired: If exiftool did not answer in time
+            EOFError: If exiftool exited before answering
+            OSError: If exiftool could not be (re)started or written to
+        """
+        if '\n' in str(file_path):
+            raise ValidationError(f"Cannot pass path with a newline to exiftool: {file_path!r}")
+        if self._proc is None:
+            self._start()
+        
+        try:
+            self._proc.stdin.write(f"{file_path}\n-execute\n")
+            self._proc.stdin.flush()
+        except OSError:
+            self._restart()
+            raise
+        
+        deadline = time.monotonic() + self.timeout
+        lines = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._restart()
+                raise subprocess.TimeoutExpired(self.executable, self.timeout)
+            if line is None:
+                self._restart()
+                raise EOFError("exiftool exited unexpectedly")
+            if line.rstrip() == self._READY:
+                break
+            lines.append(line)
+        
+        output = ''.join(lines)
+        if not output.strip():
+            raise RuntimeError(f"exiftool returned no metadata for {file_path}")
+        return json.loads(output)[0]
+    
+    def close(self) -> None:
+        """Ask exiftool to exit, killing it if it does not."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.write("-stay_open\nFalse\n")
+            self._proc.stdin.close()
+            self._proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self._kill()
+    
+    def _kill(self) -> None:
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        self._reader.join()
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
 def _extract_with_exiftool(file_path: Path, result: Dict[str, Any]):
     """Extract metadata using exiftool (if available)."""
     try:
@@ -427,34 +597,7 @@ def _extract_with_exiftool(file_path: Path, result: Dict[str, Any]):
         proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
         
         if proc.returncode == 0:
-            exif_data = json.loads(proc.stdout)[0]
-            result["metadata"]["exiftool"] = exif_data
-            result["extractor"] = "exiftool"
-            
-            # Extract timestamps from exiftool output
-            for key, value in exif_data.items():
-                if any(date_field in key.lower() for date_field in 
-                      ['date', 'time', 'created', 'modified']):
-                    try:
-                        # Try to parse the timestamp
-                        for fmt in [
-                            '%Y:%m:%d %H:%M:%S',
-                            '%Y-%m-%d %H:%M:%S',
-                            '%Y:%m:%d %H:%M:%S%z',
-                            '%Y-%m-%dT%H:%M:%S'
-                        ]:
-                            try:
-                                dt = datetime.strptime(str(value)[:19], fmt)
-                                result["timestamps"].append({
-                                    "label": f"ExifTool {key}",
-                                    "value": dt.isoformat(),
-                                    "source": "exiftool"
-                                })
-                                break
-                            except ValueError:
-                                continue
-                    except Exception as e:
-                        logger.debug(f"Failed to parse exiftool timestamp {key}={value}: {e}")
+            _add_exiftool_metadata(json.loads(proc.stdout)[0], result)
         else:
             logger.warning(f"exiftool failed: {proc.stderr}")
             
@@ -466,6 +609,38 @@ def _extract_with_exiftool(file_path: Path, result: Dict[str, Any]):
         logger.warning(f"Failed to run exiftool: {e}")
 
 
+def _extract_with_exiftool_daemon(file_path: Path, result: Dict[str, Any], daemon: 'ExifToolDaemon'):
+    """Extract metadata using an already running exiftool."""
+    try:
+        _add_exiftool_metadata(daemon.get_metadata(file_path), result)
+    except (subprocess.TimeoutExpired, EOFError, OSError) as e:
+        # The daemon has been replaced; give this file a one-off exiftool run
+        logger.warning(f"exiftool daemon failed on {file_path}: {e}")
+        _extract_with_exiftool(file_path, result)
+    except Exception as e:
+        logger.warning(f"exiftool failed for {file_path}: {e}")
+
+
+def _add_exiftool_metadata(exif_data: Dict[str, Any], result: Dict[str, Any]):
+    """Record exiftool output and the timestamps found in it."""
+    result["metadata"]["exiftool"] = exif_data
+    result["extractor"] = "exiftool"
+    
+    # Extract timestamps from exiftool output
+    for key, value in exif_data.items():
+        if any(date_field in key.lower() for date_field in _EXIFTOOL_DATE_FIELDS):
+            try:
+                dt = _parse_date(str(value))
+                if dt:
+                    result["timestamps"].append({
+                        "label": f"ExifTool {key}",
+                        "value": dt.isoformat(),
+                        "source": "exiftool"
+                    })
+            except Exception as e:
+                logger.debug(f"Failed to parse exiftool timestamp {key}={value}: {e}")
+
+
 def display_metadata(metadata: Dict[str, Any], show_timestamps: bool = True):
     """Display metadata in a formatted table."""
     if not metadata:
@@ -666,6 +841,22 @@ def _extract_elf_metadata(file_path: Path, result: Dict[str, Any]):
         logger.warning(f"Failed to extract ELF metadata from {file_path}: {e}")
 
 
+# Extractors chosen by the first four bytes of a file
+_EXTRACTORS_BY_MAGIC = {
+    b'MZ\x90\x00': _extract_pe_metadata,
+    b'\x7fELF': _extract_elf_metadata,
+}
+
+# Extractors chosen by file extension
+_EXTRACTORS_BY_EXT = {
+    **dict.fromkeys(['.jpg', '.jpeg', '.png', '.tiff', '.bmp'], _extract_image_metadata),
+    '.pdf': _extract_pdf_metadata,
+    **dict.fromkeys(['.doc', '.docx'], _extract_document_metadata),
+    **dict.fromkeys(['.mp4', '.avi', '.mov', '.mp3', '.wav', '.ogg', '.flac', '.m4a', '.wma'],
+                    _extract_media_metadata),
+}
+
+
 def _format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -675,20 +866,77 @@ def _format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} PB"
 
 
-def batch_extract_metadata(file_paths: List[Path], deep: bool = False) -> Dict[str, Dict[str, Any]]:
-    """Extract metadata from multiple files."""
-    results = {}
+def batch_extract_metadata(
+    file_paths: List[Path],
+    deep: bool = False,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract metadata from multiple files.
     
-    for file_path in file_paths:
-        try:
-            results[str(file_path)] = extract_metadata(file_path, deep=deep)
-        except Exception as e:
-            logger.error(f"Failed to extract metadata from {file_path}: {e}")
-            results[str(file_path)] = {"error": str(e), "timestamps": []}
+    Files are parsed in parallel worker processes. With deep=True most of
+    the work happens in exiftool instead, so threads are used, each taking
+    one of a set of persistent exiftool processes for every file. Results
+    are keyed by path in input order.
+    """
+    results = dict.fromkeys(map(str, file_paths))
+    
+    def failed(file_path: Path, e: Exception) -> None:
+        logger.error(f"Failed to extract metadata from {file_path}: {e}")
+        results[str(file_path)] = {"error": str(e), "timestamps": []}
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    with ExitStack() as stack:
+        extract = extract_metadata
+        if deep and workers:
+            daemons = _start_exiftool_daemons(stack, workers)
+            if daemons is not None:
+                def extract(file_path: Path, deep: bool) -> Dict[str, Any]:
+                    daemon = daemons.get()
+                    try:
+                        return extract_metadata(file_path, deep, exiftool=daemon)
+                    finally:
+                        daemons.put(daemon)
+        
+        if workers <= 1:
+            for file_path in file_paths:
+                try:
+                    results[str(file_path)] = extract(file_path, deep)
+                except Exception as e:
+                    failed(file_path, e)
+            return results
+        
+        executor_class = ThreadPoolExecutor if deep else ProcessPoolExecutor
+        with executor_class(max_workers=workers) as executor:
+            futures = {executor.submit(extract, file_path, deep): file_path
+                       for file_path in file_paths}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    results[str(file_path)] = future.result()
+                except Exception as e:
+                    failed(file_path, e)
     
     return results
 
 
+def _start_exiftool_daemons(stack: ExitStack, count: int) -> Optional[queue.Queue]:
+    """
+    Start up to count exiftool daemons, closed when stack exits.
+    
+    Returns a queue of the daemons started, or None if exiftool could not
+    be started at all (extraction then runs exiftool per file as usual).
+    """
+    daemons = queue.Queue()
+    for _ in range(count):
+        try:
+            daemons.put(stack.enter_context(ExifToolDaemon()))
+        except OSError as e:
+            logger.debug(f"Could not start exiftool daemon: {e}")
+            break
+    return daemons if not daemons.empty() else None
+
+
 if __name__ == "__main__":
     # CLI interface for standalone usage
     import argparse
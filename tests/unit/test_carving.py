@@ -20,3 +20,173 @@ def test_carve_files_none(tmp_path):
     carving.carve_files(img, outdir, types=["jpg"])
     files = list(outdir.glob("*.jpg"))
     assert len(files) == 0
+
+def test_iter_header_hits_shared_header():
+    groups = carving._group_by_header(["jpg", "jpeg", "png"])
+    # jpeg has jpg's header and footer, so it is scanned and carved once
+    assert groups[b'\xff\xd8\xff'] == (("jpg", b'\xff\xd9'),)
+    data = b'..\xff\xd8\xff..\x89PNG\r\n\x1a\n..\xff\xd8\xff'
+    hits = sorted((pos, [t for t, _ in group])
+                  for pos, _, group in carving._iter_header_hits(data, groups))
+    assert hits == [(2, ["jpg"]), (7, ["png"]), (17, ["jpg"])]
+
+def test_carve_files_all_types_carves_jpeg_once(tmp_path):
+    img = tmp_path / "disk.img"
+    img.write_bytes(b'\x00' * 10 + b'\xff\xd8\xff' + b'once' + b'\xff\xd9' + b'\x00' * 10)
+    carved = carving.carve_files(img, tmp_path / "out")
+    assert [p.name for p in carved] == ["carved_0001_10_jpg.jpg"]
+
+def test_extract_features_matches_numpy():
+    np = pytest.importorskip("numpy")
+    data = bytes(range(256)) * 3 + b'\x00\x10\x10'
+    byte_array = np.frombuffer(data, dtype=np.uint8)
+    features = carving._extract_features(data)
+    expected = [len(data), byte_array.mean(), byte_array.std(),
+                np.median(byte_array), byte_array.max(), byte_array.min()]
+    assert features[:6] == pytest.approx(expected)
+    assert 7.9 < features[6] <= 8.0  # entropy of near-uniform bytes
+
+def test_predict_file_ends_single_batch():
+    pytest.importorskip("numpy")
+    
+    class FakeModel:
+        calls = 0
+        
+        def predict(self, features):
+            self.calls += 1
+            return [row[0] // 2 for row in features]
+    
+    model = FakeModel()
+    view = memoryview(b'MZ' + b'\x00' * 98)
+    ends = carving._predict_file_ends([view, view[50:], b'MZ12'], model)
+    assert ends == [50, 25, 2]
+    assert model.calls == 1
+
+def test_carve_files_parallel_pool(tmp_path):
+    img = tmp_path / "disk.img"
+    jpg_data = b'\xff\xd8\xff' + b'parallel' + b'\xff\xd9'
+    img.write_bytes(b'\x00' * 1000 + jpg_data + b'\x00' * (3 * 1024 * 1024))
+    outdir = tmp_path / "out"
+    carved = carving.carve_files(img, outdir, types=["jpg"],
+                                 chunk_size=2 * 1024 * 1024, max_workers=2)
+    assert [p.read_bytes() for p in carved] == [jpg_data]
+
+def test_carve_files_reports_image_offsets(tmp_path):
+    img = tmp_path / "disk.img"
+    jpg_data = b'\xff\xd8\xff' + b'offset' + b'\xff\xd9'
+    img.write_bytes(b'\x00' * 1500 + jpg_data + b'\x00' * 600)
+    carved = carving.carve_files(img, tmp_path / "out", types=["jpg"], chunk_size=1024)
+    assert [p.name for p in carved] == ["carved_0001_1500_jpg.jpg"]
+
+def test_estimate_file_end_nearest_header():
+    # No BMP size/footer rule applies to exe, so the nearest later header wins
+    data = b'MZ' + b'\x00' * 10 + b'BM' + b'\x00' * 10 + b'%PDF-'
+    assert carving._estimate_file_end(data, 'exe') == 12
+    assert carving._estimate_file_end(b'MZ' + b'\x00' * 10, 'exe') == 12
+
+def test_carving_state_save_roundtrip(tmp_path):
+    state = carving.CarvingState(
+        image_path=tmp_path / "disk.img",
+        output_dir=tmp_path / "out",
+        processed_bytes=2048,
+        found_files={tmp_path / "out" / "carved_0001_0_jpg.jpg"},
+        last_position=2048
+    )
+    resume = tmp_path / "resume.json"
+    resume.write_text("stale")
+    state.save(resume)
+    assert carving.CarvingState.load(resume) == state
+    assert list(tmp_path.glob("*.tmp")) == []
+
+def test_estimate_file_end_within_bounds():
+    data = b'junk' + b'BM' + (20).to_bytes(4, 'little') + b'\x00' * 30
+    assert carving._estimate_file_end(data, 'bmp', 4) == 20
+    assert carving._estimate_file_end(data, 'bmp', 4, 14) == 10
+    pdf = b'xx%PDF-1.4 %%EOF more %%EOF tail'
+    assert carving._estimate_file_end(pdf, 'pdf', 2) == len(pdf) - 2 - len(b' tail')
+
+def test_validate_carved_file_accepts_memoryview():
+    jpg = memoryview(b'..\xff\xd8\xffbody\xff\xd9..')[2:-2]
+    assert carving._validate_carved_file(jpg, 'jpg')
+    assert not carving._validate_carved_file(jpg[:-1], 'jpg')
+    pdf = memoryview(b'%PDF-1.7 body %%EOF\n')
+    assert carving._validate_carved_file(pdf, 'pdf')
+
+def test_carve_files_across_chunk_boundary(tmp_path):
+    img = tmp_path / "disk.img"
+    jpg_data = b'\xff\xd8\xff' + b'\x01' * 100 + b'\xff\xd9'
+    # Header in the first 1 KB chunk, footer in the second
+    img.write_bytes(b'\x00' * 1000 + jpg_data + b'\x00' * 2000)
+    carved = carving.carve_files(img, tmp_path / "out", types=["jpg"], chunk_size=1024)
+    assert [p.read_bytes() for p in carved] == [jpg_data]
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_carve_files_larger_than_chunk(tmp_path, parallel):
+    img = tmp_path / "disk.img"
+    # 3 MiB JPEG whose footer lies two chunks past its header
+    jpg_data = b'\xff\xd8\xff' + b'\x01' * (3 * 1024 * 1024) + b'\xff\xd9'
+    img.write_bytes(b'\x00' * 1000 + jpg_data + b'\x00' * 1000)
+    carved = carving.carve_files(img, tmp_path / "out", types=["jpg"], parallel=parallel,
+                                 chunk_size=1024 * 1024 + 4096, max_workers=2)
+    assert [p.read_bytes() for p in carved] == [jpg_data]
+    # Ends are still not searched further than max_file_size past the header
+    assert carving.carve_files(img, tmp_path / "small", types=["jpg"], parallel=parallel,
+                               chunk_size=1024 * 1024 + 4096, max_workers=2,
+                               max_file_size=1024 * 1024) == []
+
+def test_carve_files_duplicate_types(tmp_path):
+    img = tmp_path / "disk.img"
+    img.write_bytes(b'\xff\xd8\xff' + b'dup' + b'\xff\xd9')
+    carved = carving.carve_files(img, tmp_path / "out", types=["jpg", "JPG"])
+    assert len(carved) == 1
+
+def test_extract_features_entropy_edges():
+    pytest.importorskip("numpy")
+    assert carving._extract_features(b'\x00' * 64)[6] == 0.0
+    assert carving._extract_features(bytes(range(256)))[6] == pytest.approx(8.0)
+
+def test_validate_carved_file_formats():
+    png = b'\x89PNG\r\n\x1a\n' + b'\x00' * 8 + b'IEND\xaeB`\x82'
+    assert carving._validate_carved_file(png, 'png')
+    assert not carving._validate_carved_file(png[:-1], 'png')
+    assert not carving._validate_carved_file(b'\xff\xd8\xff\xd9', 'jpg')
+    pdf = b'%PDF-1.4 ' + b'x' * 2000 + b'%%EOF'
+    assert carving._validate_carved_file(pdf, 'pdf')
+    assert not carving._validate_carved_file(b'%PDF-1.4 %%EOF' + b'x' * 2000, 'pdf')
+    assert carving._validate_carved_file(b'MZ', 'exe')
+
+def test_carve_chunk_skips_ml_for_exact_end_types():
+    class FailingModel:
+        def predict(self, features):
+            raise AssertionError("model consulted for a type with a known end")
+    
+    bmp = b'BM' + (20).to_bytes(4, 'little') + b'\x00' * 14
+    groups = carving._group_by_header(['bmp'])
+    results = carving._carve_chunk(bmp + b'\x00' * 30, 0, groups, 1024, FailingModel())
+    assert [(bytes(v), t, o) for v, t, o in results] == [(bmp, 'bmp', 0)]
+
+def test_carve_image_range_returns_spans(tmp_path, monkeypatch):
+    img = tmp_path / "disk.img"
+    jpg_data = b'\xff\xd8\xff' + b'span' + b'\xff\xd9'
+    img.write_bytes(b'\x00' * 100 + jpg_data + b'\x00' * 100)
+    monkeypatch.setattr(carving, "_worker_image", None)
+    carving._init_carving_worker(img, carving._group_by_header(['jpg']), 1024)
+    try:
+        spans = carving._carve_image_range(0, 150)
+    finally:
+        carving._worker_image.close()
+    assert spans == [(100, 100 + len(jpg_data), 'jpg')]
+
+def test_find_all_vectorized_matches_find():
+    pytest.importorskip("numpy")
+    data = b'MZ\x00MMZ\x00\x00MZ'
+    expected = [i for i in range(len(data)) if data.startswith(b'MZ', i)]
+    assert carving._find_all_vectorized(data, b'MZ', 0, len(data)) == expected
+    assert carving._find_all_vectorized(data, b'MZ', 1, 10) == [4, 8]
+    assert carving._find_all_vectorized(data, b'MZ', 9, len(data)) == []
+
+def test_write_file_truncates(tmp_path):
+    target = tmp_path / "out.bin"
+    target.write_bytes(b"x" * 100)
+    carving._write_file(target, memoryview(b"abc\x00def"))
+    assert target.read_bytes() == b"abc\x00def"
@@ -0,0 +1,112 @@
+"""
+Unit tests for the core module
+"""
+import logging
+from Artefact.core import (
+    ArtefactConfig, DEFAULT_CONFIG, ProgressTracker, format_bytes, safe_filename,
+    safe_filenames, validate_directory_path, validate_file_path
+)
+
+
+def test_config_set_does_not_leak_into_defaults():
+    """Nested settings changed on one instance must not alter DEFAULT_CONFIG."""
+    config = ArtefactConfig()
+    config.set('paths.output_dir', './elsewhere')
+    assert DEFAULT_CONFIG['paths']['output_dir'] == './output'
+    assert ArtefactConfig().get('paths.output_dir') == './output'
+
+
+def test_config_deep_merge():
+    """Custom settings are merged into nested sections, not replacing them."""
+    config = ArtefactConfig({'output': {'verbose': True}})
+    assert config.get('output.verbose') is True
+    assert config.get('output.color') is True
+
+
+def test_config_get_cache_invalidated_on_set():
+    """Cached lookups reflect later set() calls and missing keys use the default."""
+    config = ArtefactConfig()
+    assert config.get('output.quiet') is False
+    config.set('output.quiet', True)
+    assert config.get('output.quiet') is True
+    assert config.get('no.such.key', 'fallback') == 'fallback'
+    config.set('no.such.key', 1)
+    assert config.get('no.such.key', 'fallback') == 1
+
+
+def test_safe_filename():
+    """Invalid filename characters are replaced with underscores."""
+    assert safe_filename(' a<b>c:d"e/f\\g|h?i*j ') == 'a_b_c_d_e_f_g_h_i_j'
+    assert list(safe_filenames(['x:y', 'ok'])) == ['x_y', 'ok']
+
+
+def test_format_bytes():
+    """Byte counts are scaled to the largest whole binary unit."""
+    assert format_bytes(0) == "0.00 B"
+    assert format_bytes(1023) == "1023.00 B"
+    assert format_bytes(1024) == "1.00 KB"
+    assert format_bytes(1536 * 1024) == "1.50 MB"
+    assert format_bytes(2 ** 60) == "1024.00 PB"
+
+
+def test_monitoring_is_opt_in_and_replaced():
+    """No monitor runs by default; a new config stops the previous monitor."""
+    assert ArtefactConfig._monitor_thread is None
+    ArtefactConfig({'resources': {'enabled': True}})
+    stop = ArtefactConfig._monitor_stop
+    assert ArtefactConfig._monitor_thread is not None
+    ArtefactConfig()
+    assert stop.is_set()
+    assert ArtefactConfig._monitor_thread is None
+
+
+def test_validate_paths(tmp_path):
+    """File and directory validators distinguish files, dirs and missing paths."""
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("data")
+    missing = tmp_path / "missing"
+    
+    assert validate_file_path(file_path)
+    assert not validate_file_path(tmp_path)
+    assert not validate_file_path(missing)
+    assert validate_file_path(missing, must_exist=False)
+    
+    assert validate_directory_path(tmp_path)
+    assert not validate_directory_path(file_path)
+    assert not validate_directory_path(missing)
+    assert validate_directory_path(missing, create_if_missing=True)
+    assert missing.is_dir()
+
+
+def test_env_vars_map_to_sections(monkeypatch):
+    """ARTEFACT_<SECTION>_<KEY> variables override nested settings with coercion."""
+    monkeypatch.setenv("ARTEFACT_OUTPUT_VERBOSE", "True")
+    monkeypatch.setenv("ARTEFACT_RESOURCES_MONITOR_INTERVAL", "5")
+    monkeypatch.setenv("ARTEFACT_RESOURCES_MAX_CPU", "50%")
+    monkeypatch.setenv("ARTEFACT_SOME_VERSION", "1.2.3")
+    config = ArtefactConfig()
+    assert config.get('output.verbose') is True
+    assert config.get('resources.monitor_interval') == 5
+    assert config.get('resources.max_cpu') == '50%'
+    assert config.get('some_version') == '1.2.3'
+
+
+def test_output_dir_cache_follows_config(tmp_path):
+    """Cached output paths are refreshed when paths.* settings change."""
+    config = ArtefactConfig({'paths': {'output_dir': str(tmp_path / 'a')}})
+    assert config.ensure_output_dir('sub') == tmp_path / 'a' / 'sub'
+    assert (tmp_path / 'a' / 'sub').is_dir()
+    config.set('paths.output_dir', str(tmp_path / 'b'))
+    assert config.ensure_output_dir() == tmp_path / 'b'
+    assert (tmp_path / 'b').is_dir()
+
+
+def test_progress_tracker_logs_each_tenth(caplog):
+    """ProgressTracker logs about every 10% and on completion."""
+    tracker = ProgressTracker(100, "Work")
+    with caplog.at_level(logging.INFO, logger='Artefact'):
+        for _ in range(100):
+            tracker.update()
+    messages = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Work:")]
+    assert len(messages) == 10
+    assert messages[-1] == "Work: 100.0% (100/100)"
@@ -0,0 +1,226 @@
+"""
+Unit tests for the error_handler module
+"""
+import json
+from datetime import datetime
+import subprocess
+import sys
+import pytest
+from Artefact import error_handler
+from Artefact.error_handler import (
+    _flush_stats, _resolve_formatter, _format_file_not_found, _format_import,
+    _format_os,
+    _format_subprocess, _format_unexpected, register_formatter,
+    get_error_statistics, handle_error, set_statistics_enabled,
+    set_debug, set_statistics_file, validate_input, with_error_handling,
+    register_error_hook, MAX_MESSAGES_PER_TYPE,
+    ProcessingError, ValidationError
+)
+
+
+def test_resolve_formatter_most_specific():
+    """The most specific registered class in the MRO is used."""
+    assert _resolve_formatter(FileNotFoundError("x")) is _format_file_not_found
+    assert _resolve_formatter(IsADirectoryError("x")) is _format_os
+    assert _resolve_formatter(ValidationError("x")) == ValidationError._artefact_format
+    assert _resolve_formatter(subprocess.TimeoutExpired("cmd", 1)) is _format_subprocess
+    assert _resolve_formatter(KeyError("x")) is _format_unexpected
+
+
+def test_handle_error_prints_fix(capsys):
+    """handle_error prints the error and the suggested fix."""
+    handle_error(FileNotFoundError("missing.txt"), context="test")
+    out = capsys.readouterr().out
+    assert "File not found: missing.txt" in out
+    assert "Fix:" in out
+
+
+def test_handle_error_does_not_interpret_markup(capsys):
+    """Exception text containing markup-like brackets is printed verbatim."""
+    handle_error(ValueError("bad token [/] in [bold]input"))
+    assert "bad token [/] in [bold]input" in capsys.readouterr().out
+
+
+def test_validate_input_choices():
+    """Hash algorithms, output formats and file types are checked case-insensitively."""
+    assert validate_input('SHA256', 'hash_algorithm')
+    assert validate_input('Json', 'output_format')
+    assert validate_input(['JPG', 'pdf'], 'file_types')
+    with pytest.raises(ValidationError, match="Invalid file types: foo"):
+        validate_input(['jpg', 'foo'], 'file_types')
+    with pytest.raises(ValidationError, match="md5, sha1, sha256, sha512"):
+        validate_input('crc32', 'hash_algorithm')
+
+
+def test_error_statistics_batched(tmp_path):
+    """Queued statistics are applied on read and saved to the stats file."""
+    stats_file = tmp_path / "stats.json"
+    before = get_error_statistics().get('KeyError', {}).get('count', 0)
+    set_statistics_enabled(True)
+    try:
+        handle_error(KeyError("k"), context="stats")
+        assert get_error_statistics()['KeyError']['count'] == before + 1
+        
+        set_statistics_file(stats_file)
+        _flush_stats(force_save=True)
+    finally:
+        set_statistics_file(None)
+        set_statistics_enabled(False)
+    assert json.loads(stats_file.read_text())['KeyError']['count'] == before + 1
+
+
+def test_error_statistics_disabled_and_capped():
+    """Nothing is recorded while disabled; distinct messages are capped."""
+    set_statistics_enabled(False)
+    handle_error(LookupError("ignored"))
+    assert 'LookupError' not in get_error_statistics()
+    
+    set_statistics_enabled(True)
+    try:
+        for i in range(MAX_MESSAGES_PER_TYPE + 10):
+            handle_error(LookupError(f"m{i}"))
+    finally:
+        set_statistics_enabled(False)
+    stats = get_error_statistics()['LookupError']
+    assert stats['count'] == MAX_MESSAGES_PER_TYPE + 10
+    assert len(stats['messages']) == MAX_MESSAGES_PER_TYPE
+
+
+def test_validate_input_unknown_type_passes():
+    assert validate_input("anything", "not-a-type") is True
+
+
+def test_artefact_error_traceback_only_when_handling():
+    assert ValidationError("fresh").traceback is None
+    try:
+        raise KeyError("inner")
+    except KeyError:
+        err = ValidationError("wrapped")
+    assert "KeyError" in err.traceback
+    assert err.timestamp is err.timestamp
+
+
+def test_set_debug_prints_stack_trace(capsys):
+    """Stack traces are only printed while debug output is enabled."""
+    set_debug(True)
+    try:
+        handle_error(KeyError("dbg"))
+        assert "Stack trace:" in capsys.readouterr().out
+    finally:
+        set_debug(False)
+    handle_error(KeyError("dbg"))
+    assert "Stack trace:" not in capsys.readouterr().out
+
+
+def test_error_statistics_timestamps_are_iso():
+    """Timestamps are recorded as integers and formatted on read."""
+    set_statistics_enabled(True)
+    try:
+        handle_error(NotImplementedError("ts"))
+    finally:
+        set_statistics_enabled(False)
+    stats = get_error_statistics()['NotImplementedError']
+    assert datetime.fromisoformat(stats['first_seen']) <= datetime.fromisoformat(stats['last_seen'])
+
+
+def test_with_error_handling_preserves_metadata(capsys):
+    """The decorator keeps the wrapped function's metadata and re-raises."""
+    @with_error_handling(context="decorated")
+    def sample(x: int) -> int:
+        """Sample docstring."""
+        raise ValueError(f"bad {x}")
+    
+    assert sample.__name__ == "sample"
+    assert sample.__doc__ == "Sample docstring."
+    assert sample.__wrapped__ is not None
+    with pytest.raises(ValueError):
+        sample(1)
+    assert "bad 1" in capsys.readouterr().out
+
+
+def test_format_import_module_name():
+    """The module name comes from ImportError.name, else from the message."""
+    assert _format_import(ImportError("boom", name="yara"))[2].endswith("pip install yara")
+    assert _format_import(ImportError("No module named 'PIL'"))[2].endswith("pip install PIL")
+    assert _format_import(ImportError("broken"))[2].endswith("pip install unknown")
+
+
+def test_registered_hooks_run():
+    """Registered hooks receive the exception and context."""
+    seen = []
+    register_error_hook(lambda exc, ctx: seen.append((type(exc), ctx)))
+    try:
+        handle_error(RuntimeError("hooked"), context="hooks")
+    finally:
+        error_handler.ERROR_HOOKS.clear()
+        error_handler._ERROR_HOOKS_TUPLE = ()
+    assert seen == [(RuntimeError, "hooks")]
+
+
+def test_import_does_not_load_subprocess_or_rich():
+    """Importing the error handler leaves subprocess and rich unloaded."""
+    code = ("import sys, Artefact.error_handler; "
+            "print('subprocess' in sys.modules, 'rich' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_validate_input_bad_values_raise_validation_error(tmp_path):
+    """Wrong value types surface as ValidationError rather than leaking."""
+    with pytest.raises(ValidationError):
+        validate_input(None, 'file')
+    with pytest.raises(ValidationError):
+        validate_input(256, 'hash_algorithm')
+    with pytest.raises(ValidationError, match="Invalid file types: 7"):
+        validate_input(['jpg', 7], 'file_types')
+    for bad_types in (None, 5):
+        with pytest.raises(ValidationError):
+            validate_input(bad_types, 'file_types')
+    for validation_type in ('file', 'directory'):
+        with pytest.raises(ValidationError):
+            validate_input('a\0b', validation_type)
+    blocker = tmp_path / "blocker"
+    blocker.write_text("x")
+    with pytest.raises(ValidationError):
+        validate_input(blocker / "sub", 'directory', create_if_missing=True)
+
+
+def test_validate_input_paths(tmp_path):
+    """File and directory validation accept str and Path values."""
+    file_path = tmp_path / "f.txt"
+    file_path.write_text("x")
+    assert validate_input(file_path, 'file')
+    assert validate_input(str(tmp_path), 'directory')
+    with pytest.raises(ValidationError, match="Path is not a file"):
+        validate_input(tmp_path, 'file')
+    with pytest.raises(ValidationError, match="Path is not a directory"):
+        validate_input(str(file_path), 'directory')
+    with pytest.raises(ValidationError, match="File does not exist"):
+        validate_input(tmp_path / "missing", 'file')
+    with pytest.raises(ValidationError, match="Directory does not exist"):
+        validate_input(tmp_path / "missing", 'directory')
+    assert validate_input(tmp_path / "new" / "dir", 'directory', create_if_missing=True)
+    assert (tmp_path / "new" / "dir").is_dir()
+
+
+def test_register_formatter_and_artefact_subclasses():
+    """Registered formatters apply to subclasses; ArteFact errors format themselves."""
+    class CustomError(Exception):
+        pass
+    
+    class CustomChild(CustomError):
+        pass
+    
+    class ArchiveError(ProcessingError):
+        pass
+    
+    @register_formatter(CustomError)
+    def _format_custom(exc):
+        return ("Custom:", str(exc), "custom fix")
+    
+    try:
+        assert _resolve_formatter(CustomChild("x"))(CustomChild("x")) == ("Custom:", "x", "custom fix")
+        label, detail, _ = _resolve_formatter(ArchiveError("bad"))(ArchiveError("bad"))
+        assert (label, detail) == ("Processing error:", "bad")
+    finally:
+        error_handler._HANDLERS.pop(CustomError)
@@ -41,3 +41,67 @@ def test_hash_directory_recursive(temp_dir):
     
     results = hash_directory(temp_dir, "sha256", recursive=True)
     assert any("subdir" in path for path in results.keys())
+
+def test_hash_file_matches_hashlib(temp_dir, monkeypatch):
+    """Test both the file_digest and chunked read paths against hashlib."""
+    import hashlib
+    from Artefact.modules import hasher
+    data = b"chunked" * 20000  # spans several CHUNK_SIZE reads
+    test_file = temp_dir / "data.bin"
+    test_file.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+    assert hash_file(test_file, "sha256") == expected
+    monkeypatch.setattr(hasher, "_FILE_DIGEST", None)
+    assert hash_file(test_file, "SHA256") == expected
+
+def test_batch_hash_files_keeps_order(temp_dir):
+    """Test concurrent batch hashing keeps input order and reports errors."""
+    from Artefact.modules.hasher import batch_hash_files
+    files = []
+    for i in range(8):
+        files.append(temp_dir / f"file{i}.txt")
+        files[-1].write_text(f"content {i}")
+    files.insert(3, temp_dir / "missing.txt")
+    results = batch_hash_files(files, "md5")
+    assert list(results) == [str(f) for f in files]
+    assert results[str(files[3])].startswith("ERROR:")
+    assert results[str(files[0])] == hash_file(files[0], "md5")
+
+def test_hash_file_blake2b(temp_dir):
+    """Test BLAKE2b digests match hashlib."""
+    import hashlib
+    test_file = temp_dir / "data.bin"
+    test_file.write_bytes(b"blake" * 1000)
+    assert hash_file(test_file, "blake2b") == hashlib.blake2b(b"blake" * 1000).hexdigest()
+
+def test_hash_directory_hidden_and_recursive(temp_dir):
+    """Test hidden entries and recursion control in file discovery."""
+    (temp_dir / "visible.txt").write_text("a")
+    (temp_dir / ".hidden.txt").write_text("b")
+    (temp_dir / ".git").mkdir()
+    (temp_dir / ".git" / "config").write_text("c")
+    (temp_dir / "sub").mkdir()
+    (temp_dir / "sub" / "nested.txt").write_text("d")
+    
+    results = hash_directory(temp_dir, "md5")
+    assert sorted(Path(p).as_posix() for p in results) == ["sub/nested.txt", "visible.txt"]
+    
+    results = hash_directory(temp_dir, "md5", recursive=False, include_hidden=True)
+    assert sorted(results) == [".hidden.txt", "visible.txt"]
+
+def test_hash_directory_skips_unreadable_subdirectory(temp_dir, monkeypatch):
+    """Test that one unreadable subdirectory does not abort the walk."""
+    import os
+    (temp_dir / "a.txt").write_text("a")
+    (temp_dir / "locked").mkdir()
+    (temp_dir / "locked" / "b.txt").write_text("b")
+    real_scandir = os.scandir
+    
+    def scandir(path):
+        if Path(path).name == "locked":
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+    
+    monkeypatch.setattr(os, "scandir", scandir)
+    results = hash_directory(temp_dir, "md5")
+    assert list(results) == ["a.txt"]
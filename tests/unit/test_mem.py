@@ -51,3 +51,390 @@ def test_carve_binaries(tmp_path):
     memory.carve_binaries(file, outdir, types=["pe"])
     files = list(outdir.glob("*.exe"))
     assert len(files) >= 1
+
+def test_carve_files_across_chunk_boundary(tmp_path):
+    dump = tmp_path / "mem.raw"
+    jpg_data = b'\xff\xd8\xff' + b'\x00' * 2048 + b'\xff\xd9'
+    dump.write_bytes(b'\x00' * (memory._CARVE_CHUNK_SIZE - 1024) + jpg_data + b'\x00' * 64)
+    carved = memory.carve_files(dump, tmp_path / "out", file_types=["jpg"])
+    assert [p.read_bytes() for p in carved] == [jpg_data]
+
+def test_extract_iocs_per_string_boundaries():
+    strings = ["fe80::1 first", "::1", "see https://evil.example.org/x"]
+    iocs = memory.extract_iocs(strings, dedup=False)
+    assert set(iocs['ipv6']) == {"fe80::1", "::1"}
+    assert iocs['url'] == ["https://evil.example.org/x"]
+    assert "evil.example.org" in iocs['domain']
+
+def test_extract_iocs_custom_patterns_stay_within_strings(tmp_path):
+    custom = {'pair': r'foo\s+bar', 'tail': r'[^\s]+@[^,]+'}
+    iocs = memory.extract_iocs(["user foo", "bar baz", "a@b", "c.com"], custom_patterns=custom)
+    assert iocs['pair'] == []
+    assert iocs['tail'] == ['a@b']
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(b"\x00user foo\x00bar baz\x00a@b\x00c.com\x00")
+    iocs = memory.extract_dump_iocs(dump, min_length=3, custom_patterns=custom)
+    assert iocs['pair'] == []
+    assert iocs['tail'] == ['a@b']
+
+def test_extract_iocs_custom_pattern_overrides_prefilter():
+    iocs = memory.extract_iocs(["user at example dot com"],
+                               custom_patterns={'email': r'\w+ at \w+ dot com'},
+                               validate=False)
+    assert iocs['email'] == ["user at example dot com"]
+    assert iocs['url'] == []
+
+def test_string_patterns_cached():
+    assert memory._string_patterns(6) is memory._string_patterns(6)
+    assert memory._string_patterns(6)['ascii'].fullmatch(b'abcdef')
+    assert not memory._string_patterns(6)['ascii'].fullmatch(b'abcde')
+
+def test_extract_strings_across_chunk_boundary(tmp_path):
+    file = tmp_path / "mem.raw"
+    file.write_bytes(b"\x00" * (1024 * 1024 - 4) + b"boundarystring" + b"\x00")
+    strings = memory.extract_strings(file, encodings=['ascii'])
+    assert strings['ascii'] == [("boundarystring", 1024 * 1024 - 4)]
+
+def test_render_strings_plain_text():
+    strings = {'ascii': [("[red]not markup[/]", 16), ("b", 32), ("c", 48)]}
+    listing = memory._render_strings(strings, limit=2)
+    assert "0x10: [red]not markup[/]" in listing.plain
+    assert "c" not in listing.plain.split("\n")
+    assert listing.plain.endswith("...and 1 more")
+
+@pytest.mark.parametrize("encoding, pattern", [
+    ('ascii', rb'[\x20-\x7E]{4,}'),
+    ('utf-16le', rb'(?:[\x20-\x7E]\x00){4,}'),
+    ('utf-16be', rb'(?:\x00[\x20-\x7E]){4,}'),
+])
+def test_printable_runs_match_regex(monkeypatch, encoding, pattern):
+    import os
+    import re
+    monkeypatch.setattr(memory, "_PROGRESS_STEP", 64)  # force runs across windows
+    text = "x" * 75 + "\x00abc\x00abcd\x00"
+    data = (os.urandom(2000) + text.encode(encoding) + b"\x00" + text.encode(encoding)
+            + os.urandom(500) + b"tail" + "tail".encode(encoding))
+    expected = [(m.start(), m.end()) for m in re.finditer(pattern, data)]
+    spans = []
+    for _, starts, ends in memory._printable_runs(data, 4, encoding):
+        spans.extend(zip(starts, ends))
+    assert spans == expected  # already in offset order
+
+@pytest.mark.parametrize("min_length", [1, 4, 9])
+def test_utf8_runs_match_regex(monkeypatch, min_length):
+    import os
+    monkeypatch.setattr(memory, "_PROGRESS_STEP", 7)  # characters straddle windows
+    text = "caf\u00e9 \u20ac\u0905\ud7ff ok".encode("utf-8")
+    data = (os.urandom(20000) + text + b"\xed\xa0\x80" + text + b"\xc2" + text
+            + b"\xe0\x80\x80" + text[:-1])
+    pattern = memory._string_patterns(min_length)['utf-8']
+    expected = [(m.start(), m.end()) for m in pattern.finditer(data)]
+    spans = []
+    for _, starts, ends in memory._utf8_runs(data, min_length):
+        spans.extend(zip(starts, ends))
+    assert spans == expected
+
+def test_extract_strings_parallel_matches_sequential(tmp_path, monkeypatch):
+    file = tmp_path / "mem.raw"
+    file.write_bytes(b"\x00ascii text\x01" + "wide text".encode('utf-16le') + b"\x01caf\xc3\xa9s\x00")
+    sequential = memory.extract_strings(file)
+    monkeypatch.setattr(memory, "_PARALLEL_STRINGS_MIN_SIZE", 0)
+    assert memory.extract_strings(file) == sequential
+    assert sequential['utf-16le'] == [("wide text", 12)]
+
+def test_volatility_cache_roundtrip(tmp_path, monkeypatch):
+    dump = tmp_path / "mem.raw"
+    data = bytearray(3 * 1024 * 1024)
+    dump.write_bytes(data)
+    fingerprint = memory._dump_fingerprint(dump, len(data))
+    data[len(data) // 2] = 1  # middle bytes are not part of the fingerprint
+    dump.write_bytes(data)
+    assert memory._dump_fingerprint(dump, len(data)) == fingerprint
+    data[-1] = 1
+    dump.write_bytes(data)
+    assert memory._dump_fingerprint(dump, len(data)) != fingerprint
+
+    cache_path = tmp_path / "cache" / f"mem-{fingerprint}.json"
+    assert memory._load_volatility_cache(cache_path) is None
+    memory._save_volatility_cache(cache_path, {"info": None, "pslist": None})
+    assert not cache_path.exists()
+    results = {"info": {"major": "10"}, "pslist": [{"PID": 4}]}
+    memory._save_volatility_cache(cache_path, results)
+    assert memory._load_volatility_cache(cache_path) == results
+    monkeypatch.setattr(memory, "_VOLATILITY_CACHE_VERSION", memory._VOLATILITY_CACHE_VERSION + 1)
+    assert memory._load_volatility_cache(cache_path) is None
+
+def test_run_volatility_plugins_concurrently(monkeypatch):
+    import threading
+    barrier = threading.Barrier(len(memory._VOLATILITY_PLUGINS), timeout=5)
+    constructed_on = []
+
+    def fake_construct(context, plugin_name, config_path):
+        constructed_on.append(threading.current_thread())
+        return plugin_name
+
+    def fake_render(plugin, plugin_name):
+        barrier.wait()  # only returns once every plugin is running
+        if plugin == "windows.info.Info":
+            raise RuntimeError("unreadable layer")
+        return [{"PID": 4}]
+
+    monkeypatch.setattr(memory, "_construct_volatility_plugin", fake_construct)
+    monkeypatch.setattr(memory, "_render_volatility_plugin", fake_render)
+    results = memory._run_volatility_plugins(object(), "plugins")
+    assert results == {"info": None, "pslist": [{"PID": 4}]}
+    assert list(results) == list(memory._VOLATILITY_PLUGINS)
+    # Construction touches the shared context, so it stays on this thread
+    assert constructed_on == [threading.current_thread()] * len(memory._VOLATILITY_PLUGINS)
+
+def test_load_or_compile_rules_uses_cache(tmp_path, monkeypatch):
+    import types
+
+    class FakeRules:
+        def save(self, path):
+            Path(path).write_bytes(b"compiled")
+
+    calls = []
+
+    def load(path):
+        if not Path(path).exists():
+            raise FakeError(path)
+        calls.append("load")
+        return FakeRules()
+
+    def compile(filepaths):
+        calls.append(("compile", sorted(filepaths)))
+        return FakeRules()
+
+    FakeError = type("FakeError", (Exception,), {})
+    fake_yara = types.SimpleNamespace(Error=FakeError, load=load, compile=compile, __version__="4.0")
+    monkeypatch.setattr(memory, "yara", fake_yara)
+    monkeypatch.setattr(memory, "_CACHE_DIR", tmp_path / "cache")
+    rule_dir = tmp_path / "rules"
+    (rule_dir / "sub").mkdir(parents=True)
+    (rule_dir / "a.yar").write_text("rule a { condition: true }")
+    (rule_dir / "sub" / "b.yara").write_text("rule b { condition: true }")
+    (rule_dir / "notes.txt").write_text("ignored")
+
+    memory._load_or_compile_rules(rule_dir)
+    memory._load_or_compile_rules(rule_dir)
+    assert calls == [("compile", ["a.yar", "sub/b.yara"]), "load"]
+
+    (rule_dir / "a.yar").write_text("rule a { condition: false }")
+    memory._load_or_compile_rules(rule_dir)
+    assert calls[-1][0] == "compile"
+
+def test_find_headers_matches_find(tmp_path):
+    import mmap
+    import os
+    headers = [sig['header'] for sig in memory._CARVE_SIGNATURES.values()]
+    data = bytearray(os.urandom(4096))
+    for header in headers:
+        data += header * 2 + os.urandom(100) + header[:1] + b"x"
+    data += b"\x89PNG\r\n"  # truncated header at the very end
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(data)
+    start, stop = 10, len(data) - 60
+    with dump.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        found = memory._find_headers(mm, headers, start, stop)
+        for header in headers:
+            expected = []
+            pos = data.find(header, start)
+            while pos != -1 and pos < stop:
+                expected.append(pos)
+                pos = data.find(header, pos + 1)
+            assert found[header] == expected
+
+def test_validate_iocs_ipv4_and_hashes():
+    validated = memory._validate_iocs({
+        'ipv4': ["10.0.0.1", "010.1.1.255", "256.1.1.1", "1.2.3", "1.2.3.4.5", "0x1.2.3.4"],
+        'md5': ["D41D8CD98F00B204E9800998ECF8427E", "z" * 32, "", "abéd"],
+        'sha1': ["da39a3ee5e6b4b0d3255bfef95601890afd80709"],
+    })
+    assert validated['ipv4'] == ["10.0.0.1", "010.1.1.255"]
+    assert validated['md5'] == ["d41d8cd98f00b204e9800998ecf8427e", ""]
+    assert validated['sha1'] == ["da39a3ee5e6b4b0d3255bfef95601890afd80709"]
+
+def test_extract_iocs_dedups_case_variants_of_hashes():
+    iocs = memory.extract_iocs(["D41D8CD98F00B204E9800998ECF8427E", "d41d8cd98f00b204e9800998ecf8427e"])
+    assert iocs['md5'] == ["d41d8cd98f00b204e9800998ecf8427e"]
+
+def test_extract_iocs_skips_types_ruled_out_by_prefilter(monkeypatch):
+    strings = ["Suspicious IP: 192.168.1.1 see http://example.com"]
+    expected = memory.extract_iocs(strings)
+    monkeypatch.setattr(memory, "HYPERSCAN_AVAILABLE", True)
+    monkeypatch.setattr(memory, "_present_ioc_types", lambda text: {"ipv4"})
+    iocs = memory.extract_iocs(strings, custom_patterns={"url": r"https?://\S+"})
+    assert iocs['ipv4'] == expected['ipv4']
+    assert iocs['url'] == expected['url']  # overridden patterns always run
+    assert iocs['domain'] == []
+
+@pytest.mark.skipif(not memory.HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+def test_extract_iocs_hyperscan_matches_re(monkeypatch):
+    strings = ["admin@example.com 10.0.0.1 fe80::1ff:fe23:4567:890a", "d41d8cd98f00b204e9800998ecf8427e"]
+    with_prefilter = memory.extract_iocs(strings)
+    monkeypatch.setattr(memory, "HYPERSCAN_AVAILABLE", False)
+    assert {k: sorted(v) for k, v in with_prefilter.items()} == \
+        {k: sorted(v) for k, v in memory.extract_iocs(strings).items()}
+
+def test_extract_dump_iocs_matches_string_path(tmp_path):
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(
+        b"\x00\x01visit http://evil.example.com/x now\x00\xff10.0.0.7\x02"
+        + "wide admin@example.com".encode('utf-16le') + b"\x00\x00"
+        + b"D41D8CD98F00B204E9800998ECF8427E\x00"
+    )
+    strings = memory.extract_strings(dump, encodings=['ascii', 'utf-16le', 'utf-16be'])
+    expected = memory.extract_iocs([s for matches in strings.values() for s, _ in matches])
+    iocs = memory.extract_dump_iocs(dump)
+    assert {k: sorted(v) for k, v in iocs.items()} == {k: sorted(v) for k, v in expected.items()}
+    assert iocs['ipv4'] == ["10.0.0.7"]
+    assert iocs['email'] == ["admin@example.com"]
+    assert iocs['md5'] == ["d41d8cd98f00b204e9800998ecf8427e"]
+
+def test_carve_files_parallel_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory, "_CARVE_CHUNK_SIZE", 4096)
+    monkeypatch.setattr(memory, "_CARVE_RANGE_SIZE", 8192)
+    jpg_data = b'\xff\xd8\xff' + b'\x00' * 2048 + b'\xff\xd9'
+    nested = b'\xff\xd8\xff' + b'\x01' * 2000 + jpg_data  # carved once, as one file
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(b'\x00' * 7000 + nested + b'\x00' * 9000 + jpg_data + b'\x00' * 100)
+    sequential = memory.carve_files(dump, tmp_path / "seq", file_types=["jpg"], parallel=False)
+    parallel = memory.carve_files(dump, tmp_path / "par", file_types=["jpg"], max_workers=2)
+    assert [p.read_bytes() for p in parallel] == [p.read_bytes() for p in sequential]
+    assert [len(p.read_bytes()) for p in sequential] == [len(nested), len(jpg_data)]
+
+def _pe_header(size):
+    """Minimal PE header whose one section ends size bytes from its start."""
+    pe = bytearray(0x200)
+    pe[:2] = b'MZ'
+    pe[0x3c:0x40] = (0x80).to_bytes(4, 'little')
+    pe[0x80:0x84] = b'PE\0\0'
+    pe[0x86:0x88] = (1).to_bytes(2, 'little')
+    section = 0x80 + 0xF8
+    pe[section + 16:section + 24] = (size - 0x200).to_bytes(4, 'little') + (0x200).to_bytes(4, 'little')
+    return bytes(pe)
+
+def test_carve_files_parallel_after_spilled_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory, "_CARVE_RANGE_SIZE", 4096)
+    data = bytearray(16000)
+    for offset, size in ((0, 6000),      # spills into the second range
+                         (5000, 9000),   # inside the first file
+                         (7000, 600)):   # real file a worker would skip
+        data[offset:offset + 0x200] = _pe_header(size)
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(data)
+    sequential = memory.carve_files(dump, tmp_path / "seq", file_types=["pe"], min_size=64,
+                                    parallel=False)
+    parallel = memory.carve_files(dump, tmp_path / "par", file_types=["pe"], min_size=64,
+                                  max_workers=2)
+    assert [len(p.read_bytes()) for p in sequential] == [6000, 600]
+    assert [p.read_bytes() for p in parallel] == [p.read_bytes() for p in sequential]
+
+def test_carve_files_stops_at_next_header(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory, "_CARVE_CHUNK_SIZE", 4096)
+    elf_data = b'\x7fELF\x02' + b'\x00' * 3000
+    png_data = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100 + b'IEND\xaeB`\x82'
+    dump = tmp_path / "mem.raw"
+    # The second ELF ends at a header past the end of its chunk
+    dump.write_bytes(elf_data + png_data + b'\x00' * 500 + elf_data + png_data + elf_data)
+    carved = memory.carve_files(dump, tmp_path / "out", file_types=["elf"])
+    assert [len(p.read_bytes()) for p in carved] == [len(elf_data)] * 3
+
+def test_carve_files_elf_ignores_stray_mz(tmp_path):
+    import struct
+    # 64-bit little-endian ELF whose section header table ends the file
+    elf = bytearray(5000)
+    elf[:6] = b'\x7fELF\x02\x01'
+    struct.pack_into('<Q', elf, 0x28, 5000 - 3 * 64)
+    struct.pack_into('<HH', elf, 0x3A, 64, 3)
+    elf[1000:1002] = elf[2000:2002] = b'MZ'  # not PE headers
+    # Without a section table the end falls back to the next real header
+    bare = bytearray(b'\x7fELF\x01' + b'\x00' * 2995)
+    bare[1500:1502] = b'MZ'
+    png_data = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100 + b'IEND\xaeB`\x82'
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(bytes(elf) + b'\x00' * 300 + bytes(bare) + png_data)
+    carved = memory.carve_files(dump, tmp_path / "out", file_types=["elf"])
+    assert [p.read_bytes() for p in carved] == [bytes(elf), bytes(bare)]
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_write_dump_range(tmp_path, monkeypatch, kernel_copy):
+    import mmap
+    if not kernel_copy:
+        monkeypatch.setattr(memory, "_COPY_FILE_RANGE", None)
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(bytes(range(256)) * 64)
+    out = tmp_path / "out.bin"
+    with dump.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        memory._write_dump_range(f.fileno(), mm, out, 100, 9000)
+    assert out.read_bytes() == dump.read_bytes()[100:9000]
+
+def test_validators_accept_memoryviews():
+    pe = bytearray(0x200)
+    pe[:2] = b'MZ'
+    pe[0x3c:0x40] = (0x80).to_bytes(4, 'little')
+    pe[0x80:0x84] = b'PE\0\0'
+    pe[0x86:0x88] = (1).to_bytes(2, 'little')  # one section
+    section = 0x80 + 0xF8
+    pe[section + 16:section + 24] = (0x40).to_bytes(4, 'little') + (0x100).to_bytes(4, 'little')
+    samples = {
+        'pe': bytes(pe),
+        'jpg': b'\xff\xd8\xff' + b'\x00' * 10 + b'\xff\xd9',
+        'pdf': b'%PDF-1.4 body %%EOF\n',
+    }
+    for file_type, data in samples.items():
+        validate = memory._CARVE_SIGNATURES[file_type]['validate']
+        with memoryview(data) as view:
+            assert validate(view) and validate(data)
+            assert not validate(view[1:])
+    with memoryview(samples['pe']) as view:
+        assert memory._find_file_end(view, 'pe') == memory._find_file_end(samples['pe'], 'pe') == 0x140
+        assert memory._find_file_end(view[:0x50], 'pe') == 0x50
+
+def test_custom_ioc_patterns_compiled_once():
+    memory._custom_ioc_pattern.cache_clear()
+    for _ in range(3):
+        memory.extract_iocs(["ticket ABC-123"], custom_patterns={'ticket': r'\b[A-Z]+-\d+\b'})
+    info = memory._custom_ioc_pattern.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+def test_region_table_rows_and_content(tmp_path):
+    import json
+    import mmap
+    from dataclasses import asdict
+    dump_file = tmp_path / "mem.raw"
+    dump_file.write_bytes(bytes(range(256)))
+    dump = memory.MemoryDump(path=dump_file, format='.raw', size=256)
+    regions = [memory.MemoryRegion(16, 32, "r-x", "commit", "image", "ntdll.dll"),
+               memory.MemoryRegion(128, 8, "rw-", "commit", "private")]
+    for region in regions:
+        dump.regions.append(region)
+    assert len(dump.regions) == 2
+    assert list(dump.regions) == regions
+    with dump_file.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with dump.regions.content(mm, 1) as content:
+            assert content == bytes(range(128, 136))
+    encoded = json.loads(json.dumps(memory._dump_record(dump), default=memory._json_default))
+    assert encoded['regions'] == [asdict(region) for region in regions]
+    assert encoded['path'] == str(dump_file)
+
+def test_write_json_streams_to_stdout(capsys):
+    import json
+    from datetime import datetime
+    memory._write_json({'ascii': [("hello", 0)], 'when': datetime(2024, 1, 2, 3, 4, 5)})
+    out = capsys.readouterr().out
+    assert json.loads(out) == {'ascii': [["hello", 0]], 'when': "2024-01-02 03:04:05"}
+    assert out.endswith("}\n")
+
+def test_stream_iocs_across_windows(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory, "_PROGRESS_STEP", 64)
+    dump = tmp_path / "mem.raw"
+    dump.write_bytes(b"\x00" * 50 + b"host 10.0.0.7 up\x00" * 20
+                     + "wide 10.0.0.8".encode('utf-16le') + b"\x01")
+    batches = list(memory.stream_iocs(dump))
+    assert len([b for b in batches if b[0] == 'ipv4']) > 1  # one per window
+    ips = [ip for ioc_type, matches in batches if ioc_type == 'ipv4' for ip in matches]
+    # UTF-16LE text read one byte later is valid UTF-16BE, so both passes match it
+    assert ips == ["10.0.0.7"] * 20 + ["10.0.0.8"] * 2
+    assert sorted(memory.extract_dump_iocs(dump)['ipv4']) == ["10.0.0.7", "10.0.0.8"]
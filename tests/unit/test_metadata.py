@@ -1,8 +1,9 @@
 """
 Unit tests for the metadata module
 """
+import subprocess
 import pytest
-from Artefact.modules.metadata import extract_metadata
+from Artefact.modules.metadata import extract_metadata, batch_extract_metadata, ExifToolDaemon
 
 def test_extract_metadata_basic(sample_files):
     """Test basic metadata extraction."""
@@ -18,6 +19,12 @@ def test_extract_metadata_nonexistent():
     assert len(result['timestamps']) == 0
     assert 'error' in result
 
+def test_extract_metadata_directory(temp_dir):
+    """Test metadata extraction from a directory."""
+    result = extract_metadata(temp_dir)
+    assert result['timestamps'] == []
+    assert 'not a file' in result['error']
+
 def test_extract_metadata_empty(sample_files):
     """Test metadata extraction from empty file."""
     result = extract_metadata(sample_files['empty'])
@@ -29,3 +36,117 @@ def test_extract_metadata_binary(sample_files):
     result = extract_metadata(sample_files['binary'])
     assert isinstance(result, dict)
     assert 'timestamps' in result
+
+def test_extract_metadata_dispatches_by_extension(sample_files, monkeypatch):
+    """Test that extractors are chosen by extension and honour include_exif."""
+    from Artefact.modules import metadata
+    calls = []
+    monkeypatch.setattr(metadata, "_extract_image_metadata", lambda path, result: calls.append(path))
+    monkeypatch.setitem(metadata._EXTRACTORS_BY_EXT, '.jpg', metadata._extract_image_metadata)
+    extract_metadata(sample_files['image'])
+    extract_metadata(sample_files['image'], include_exif=False)
+    assert calls == [sample_files['image']]
+
+def test_batch_extract_metadata_parallel(sample_files):
+    """Test that parallel batch extraction matches sequential extraction."""
+    paths = [sample_files['text'], sample_files['binary'], sample_files['empty']]
+    sequential = batch_extract_metadata(paths, max_workers=1)
+    parallel = batch_extract_metadata(paths, max_workers=2)
+    assert list(parallel) == [str(p) for p in paths]
+    for path in paths:  # access times change between the runs
+        assert parallel[str(path)]['file_size'] == sequential[str(path)]['file_size']
+        assert len(parallel[str(path)]['timestamps']) == len(sequential[str(path)]['timestamps'])
+
+FAKE_EXIFTOOL = '''#!{python}
+import json, sys, time
+def answer(path):
+    print(json.dumps([{{"SourceFile": path, "CreateDate": "2020:01:02 03:04:05"}}]))
+if "-stay_open" not in sys.argv:
+    answer(sys.argv[-1])
+    sys.exit()
+path = previous = None
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if previous == "-stay_open" and line == "False":
+        break
+    if line == "-execute":
+        if path.endswith(".hang"):
+            time.sleep(60)
+        if path.endswith(".crash"):
+            sys.exit(1)
+        answer(path)
+        print("{{ready}}", flush=True)
+    elif line != "-stay_open":
+        path = line
+    previous = line
+'''
+
+@pytest.fixture
+def fake_exiftool(tmp_path, monkeypatch):
+    """Install a stand-in exiftool that speaks the -stay_open protocol."""
+    import os
+    import stat
+    import sys
+    script = tmp_path / "bin" / "exiftool"
+    script.parent.mkdir()
+    script.write_text(FAKE_EXIFTOOL.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+def test_exiftool_daemon_reuses_process(fake_exiftool, sample_files):
+    """Test that one exiftool process serves several files."""
+    with ExifToolDaemon() as daemon:
+        pid = daemon._proc.pid
+        for name in ('text', 'binary'):
+            data = daemon.get_metadata(sample_files[name])
+            assert data['SourceFile'] == str(sample_files[name])
+        assert daemon._proc.pid == pid
+        proc = daemon._proc
+    assert proc.returncode == 0
+
+@pytest.mark.parametrize("name, error", [
+    ("file.hang", subprocess.TimeoutExpired),
+    ("file.crash", EOFError),
+])
+def test_exiftool_daemon_recovers(fake_exiftool, tmp_path, sample_files, name, error):
+    """Test that a hung or exited exiftool is replaced and the file still extracted."""
+    bad = tmp_path / name
+    bad.write_bytes(b'data')
+    with ExifToolDaemon(timeout=1) as daemon:
+        pid = daemon._proc.pid
+        with pytest.raises(error):
+            daemon.get_metadata(bad)
+        assert daemon._proc.pid != pid
+        data = daemon.get_metadata(sample_files['text'])
+        assert data['SourceFile'] == str(sample_files['text'])
+        # The failing file falls back to a one-off exiftool run
+        result = extract_metadata(bad, deep=True, exiftool=daemon)
+        assert result['extractor'] == 'exiftool'
+        assert result['metadata']['exiftool']['SourceFile'] == str(bad)
+
+def test_batch_extract_metadata_deep_uses_daemon(fake_exiftool, sample_files):
+    """Test deep batch extraction through persistent exiftool processes."""
+    paths = [sample_files['text'], sample_files['binary'], sample_files['empty']]
+    results = batch_extract_metadata(paths, deep=True, max_workers=2)
+    for path in paths:
+        assert results[str(path)]['extractor'] == 'exiftool'
+        assert any(t['label'] == 'ExifTool CreateDate' and t['value'] == '2020-01-02T03:04:05'
+                   for t in results[str(path)]['timestamps'])
+
+@pytest.mark.parametrize("value, expected", [
+    ("20200102030405+01'00'", "2020-01-02T03:04:05"),
+    ("20200102", "2020-01-02T00:00:00"),
+    ("2020:01:02 03:04:05", "2020-01-02T03:04:05"),
+    ("2020:01:02 03:04:05+02:00", "2020-01-02T03:04:05"),
+    ("2020-01-02T03:04:05.123Z", "2020-01-02T03:04:05"),
+    ("2020-01-02 03:04:05", "2020-01-02T03:04:05"),
+    ("0000:00:00 00:00:00", None),
+    ("1/60", None),
+    ("", None),
+])
+def test_parse_date(value, expected):
+    """Test parsing of PDF and exiftool date strings."""
+    from Artefact.modules.metadata import _parse_date
+    dt = _parse_date(value)
+    assert (dt.isoformat() if dt else None) == expected